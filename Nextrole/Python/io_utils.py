@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+I/O Helpers
+JSON encoding, result output and cache files shared by the entry scripts and scrapers
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fallback to the stdlib json module
+
+
+def json_loads(data: Union[bytes, str]):
+    """Parse JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def write_cache_file(path: Path, content: bytes):
+    """Write a cache file (best effort, atomic rename)"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass  # Caching is an optimization; never fail a parse or search over it
+
+
+def write_result(result: Dict):
+    """Write one JSON result line to stdout"""
+    sys.stdout.buffer.write(json_dumps(result) + b"\n")
+    sys.stdout.flush()
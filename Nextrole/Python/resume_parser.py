@@ -4,17 +4,25 @@ Resume Parser Module
 Extracts structured data from PDF resumes
 """
 
-import json
+import hashlib
 import sys
 import re
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional, Union
 
 try:
     from pypdf import PdfReader
 except ImportError:
     from PyPDF2 import PdfReader  # Fallback
 
+from io_utils import json_dumps, json_loads, write_cache_file, write_result
+
+# Parsed resumes are cached by SHA-256 of the PDF bytes.
+# Bump CACHE_VERSION whenever extraction output changes.
+CACHE_DIR = Path.home() / '.cache' / 'nextrole' / 'resume'
+CACHE_VERSION = 3
+
 # Common tech skills for developers
 TECH_SKILLS = {
     # Programming Languages
@@ -55,63 +63,100 @@ TECH_SKILLS = {
 }
 
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    """Extract text content from PDF file"""
+def _skill_pattern(skill: str) -> str:
+    """Whole-word regex for a single skill"""
+    return r'\b' + re.escape(skill) + r'\b'
+
+
+# One alternation over all skills, longest first so "react native" wins over
+# "react". The lookahead makes the match zero-width, so the scan is tried at
+# every position and overlapping skills ("gitlab ci" / "ci/cd") are all found.
+SKILLS_PATTERN = re.compile(
+    '(?=(' + '|'.join(_skill_pattern(skill) for skill in sorted(TECH_SKILLS, key=len, reverse=True)) + '))'
+)
+
+# Shorter skills starting where a longer one does (e.g. "android" in
+# "android studio"); only the longest match is reported at each position
+NESTED_SKILLS = {
+    skill: tuple(
+        other for other in TECH_SKILLS
+        if other != skill and re.match(_skill_pattern(other), skill)
+    )
+    for skill in TECH_SKILLS
+}
+
+# Version patterns (e.g., "Python 3.9", "iOS 15")
+VERSION_PATTERNS = [
+    re.compile(r'\b(Python|Java|Swift|Kotlin|Go|Rust|Ruby|PHP|Node\.js)\s+\d+', re.IGNORECASE),
+    re.compile(r'\b(iOS|Android)\s+\d+', re.IGNORECASE),
+    re.compile(r'\b(React|Angular|Vue)\s+\d+', re.IGNORECASE),
+]
+
+# Common developer-related terms
+KEYWORD_PATTERNS = [
+    re.compile(r'\b(full-stack|full stack|frontend|front-end|backend|back-end|devops)\b', re.IGNORECASE),
+    re.compile(r'\b(senior|lead|principal|staff|architect)\b', re.IGNORECASE),
+    re.compile(r'\b(engineer|developer|programmer|architect)\b', re.IGNORECASE),
+    re.compile(r'\b(open source|open-source)\b', re.IGNORECASE),
+    re.compile(r'\b(distributed systems|scalability|performance|security)\b', re.IGNORECASE),
+    re.compile(r'\b(api design|system design|database design)\b', re.IGNORECASE),
+]
+
+# Job titles and date ranges (e.g., "Senior iOS Engineer", "2019 - Present"),
+# scanned together in one pass; [^\S\n] keeps each match on a single line
+EXPERIENCE_PATTERN = re.compile(
+    r'(?P<title>(?i:(Senior|Lead|Principal|Staff|Junior)?[^\S\n]*(Software|iOS|Android|Full[- ]Stack|Frontend|Backend|DevOps)?[^\S\n]*(Engineer|Developer|Architect|Programmer)))'
+    r'|(?P<date>(\d{4})[^\S\n]*[-–—][^\S\n]*(\d{4}|Present|Current))'
+)
+
+# Company names (uppercase words, possibly with Inc, LLC, etc.)
+COMPANY_PATTERN = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+(?:Inc|LLC|Corp|Corporation|Ltd))?)')
+
+# City, state (e.g., "Austin, TX") or a bare state code; the city is optional
+LOCATION_PATTERN = re.compile(r'\b(?:([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*)?([A-Z]{2})\b')
+
+YEAR_PATTERN = re.compile(r'\d{4}')
+
+
+def extract_text_from_pdf(pdf_file: Union[str, BinaryIO]) -> str:
+    """Extract text content from a PDF path or binary stream"""
     try:
-        reader = PdfReader(pdf_path)
-        text = ""
-        for page in reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
+        reader = PdfReader(pdf_file)
+        # Join once instead of growing a string per page; skip empty pages
+        return "\n".join(filter(None, (page.extract_text() for page in reader.pages))).strip()
     except Exception as e:
         return f"Error extracting text: {str(e)}"
 
 
-def extract_skills(text: str) -> List[str]:
-    """Extract technical skills from resume text"""
-    text_lower = text.lower()
+def extract_skills(text: str, text_lower: Optional[str] = None) -> List[str]:
+    """Extract technical skills from resume text (text_lower: precomputed text.lower())"""
+    if text_lower is None:
+        text_lower = text.lower()
     found_skills = set()
 
-    # Look for exact matches and common variations
-    for skill in TECH_SKILLS:
-        # Create pattern that matches whole words
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text_lower):
-            found_skills.add(skill.title())
+    # Single scan for every skill; credit shorter skills sharing a longer match's start
+    for match in SKILLS_PATTERN.finditer(text_lower):
+        skill = match.group(1)
+        found_skills.add(skill.title())
+        for nested in NESTED_SKILLS.get(skill, ()):
+            found_skills.add(nested.title())
 
     # Look for version patterns (e.g., "Python 3.9", "iOS 15")
-    version_patterns = [
-        r'\b(Python|Java|Swift|Kotlin|Go|Rust|Ruby|PHP|Node\.js)\s+\d+',
-        r'\b(iOS|Android)\s+\d+',
-        r'\b(React|Angular|Vue)\s+\d+',
-    ]
-
-    for pattern in version_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
+    for pattern in VERSION_PATTERNS:
+        for match in pattern.finditer(text):
             found_skills.add(match.group(0))
 
     return sorted(list(found_skills))
 
 
-def extract_keywords(text: str) -> List[str]:
-    """Extract important keywords beyond just tech skills"""
+def extract_keywords(text: str, text_lower: Optional[str] = None) -> List[str]:
+    """Extract important keywords beyond just tech skills (text_lower: precomputed text.lower())"""
     keywords = set()
 
-    # Common developer-related terms
-    keyword_patterns = [
-        r'\b(full-stack|full stack|frontend|front-end|backend|back-end|devops)\b',
-        r'\b(senior|lead|principal|staff|architect)\b',
-        r'\b(engineer|developer|programmer|architect)\b',
-        r'\b(open source|open-source)\b',
-        r'\b(distributed systems|scalability|performance|security)\b',
-        r'\b(api design|system design|database design)\b',
-    ]
-
-    text_lower = text.lower()
-    for pattern in keyword_patterns:
-        matches = re.finditer(pattern, text_lower, re.IGNORECASE)
-        for match in matches:
+    if text_lower is None:
+        text_lower = text.lower()
+    for pattern in KEYWORD_PATTERNS:
+        for match in pattern.finditer(text_lower):
             keywords.add(match.group(0).lower())
 
     return sorted(list(keywords))
@@ -121,28 +166,29 @@ def extract_experience(text: str) -> List[Dict[str, str]]:
     """Extract work experience from resume"""
     experiences = []
 
-    # Look for common job title patterns
-    job_title_pattern = r'(Senior|Lead|Principal|Staff|Junior)?\s*(Software|iOS|Android|Full[- ]Stack|Frontend|Backend|DevOps)?\s*(Engineer|Developer|Architect|Programmer)'
-
-    # Look for company names (uppercase words, possibly with Inc, LLC, etc.)
-    company_pattern = r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+(?:Inc|LLC|Corp|Corporation|Ltd))?)'
-
-    # Look for date ranges
-    date_pattern = r'(\d{4})\s*[-–—]\s*(\d{4}|Present|Current)'
+    # First title and first date range on each line, from a single scan
+    titles = {}
+    dates = {}
+    line_no = 0
+    pos = 0
+    for match in EXPERIENCE_PATTERN.finditer(text):
+        line_no += text.count('\n', pos, match.start())
+        pos = match.start()
+        if match.group('title') is not None:
+            titles.setdefault(line_no, match.group('title'))
+        else:
+            dates.setdefault(line_no, match.group('date'))
 
     lines = text.split('\n')
-    for i, line in enumerate(lines):
-        title_match = re.search(job_title_pattern, line, re.IGNORECASE)
-        date_match = re.search(date_pattern, line)
-
-        if title_match and date_match:
-            title = title_match.group(0).strip()
-            duration = date_match.group(0).strip()
+    for i, title in titles.items():
+        if i in dates:
+            title = title.strip()
+            duration = dates[i].strip()
 
             # Look for company in nearby lines
             company = "Unknown Company"
             for j in range(max(0, i-2), min(len(lines), i+3)):
-                company_match = re.search(company_pattern, lines[j])
+                company_match = COMPANY_PATTERN.search(lines[j])
                 if company_match and company_match.group(0) != title:
                     company = company_match.group(0).strip()
                     break
@@ -152,26 +198,23 @@ def extract_experience(text: str) -> List[Dict[str, str]]:
                 "company": company,
                 "duration": duration
             })
+            if len(experiences) == 5:
+                break
 
-    return experiences[:5]  # Return max 5 experiences
+    return experiences  # Return max 5 experiences
 
 
 def extract_location(text: str) -> Optional[str]:
     """Extract location from resume"""
-    # Look for city, state patterns
-    location_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})\b'
-    match = re.search(location_pattern, text)
-
-    if match:
-        return f"{match.group(1)}, {match.group(2)}"
-
-    # Look for just state
-    state_pattern = r'\b([A-Z]{2})\b'
-    match = re.search(state_pattern, text)
-    if match:
-        return match.group(1)
+    # Prefer the first city, state pair; fall back to the first bare state
+    state = None
+    for match in LOCATION_PATTERN.finditer(text):
+        if match.group(1):
+            return f"{match.group(1)}, {match.group(2)}"
+        if state is None:
+            state = match.group(2)
 
-    return None
+    return state
 
 
 def calculate_years_of_experience(experiences: List[Dict[str, str]]) -> int:
@@ -181,50 +224,88 @@ def calculate_years_of_experience(experiences: List[Dict[str, str]]) -> int:
 
     for exp in experiences:
         duration = exp.get('duration', '')
-        # Extract start and end years
-        years = re.findall(r'\d{4}', duration)
-        if len(years) >= 2:
-            start_year = int(years[0])
-            end_year = int(years[1]) if years[1].isdigit() else current_year
-            total_years += (end_year - start_year)
+        # Extract start and end years (only the first two are ever used)
+        years = YEAR_PATTERN.finditer(duration)
+        start = next(years, None)
+        end = next(years, None)
+        if start and end:
+            total_years += (int(end.group()) - int(start.group()))
         elif 'Present' in duration or 'Current' in duration:
-            if years:
-                start_year = int(years[0])
-                total_years += (current_year - start_year)
+            if start:
+                total_years += (current_year - int(start.group()))
 
     return total_years
 
 
+def load_cached_result(digest: str) -> Optional[Dict]:
+    """Return a previously parsed resume for this digest, if cached"""
+    try:
+        return json_loads(_cache_path(digest).read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_result(digest: str, result: Dict):
+    """Write a parsed resume to the cache"""
+    write_cache_file(_cache_path(digest), json_dumps(result))
+
+
+def _cache_path(digest: str) -> Path:
+    return CACHE_DIR / f"{digest}-v{CACHE_VERSION}.json"
+
+
+def _error_result(message: str) -> Dict:
+    return {
+        "error": message,
+        "text": "",
+        "skills": [],
+        "keywords": [],
+        "experience": [],
+        "location": None,
+        "yearsExperience": 0
+    }
+
+
 def parse_resume(pdf_path: str) -> Dict:
     """
     Main function to parse resume and return structured data
 
+    Results are cached by SHA-256 of the file bytes, so re-parsing an
+    unchanged PDF is a single file read.
+
     Returns:
         Dictionary with parsed resume data
     """
+    try:
+        pdf_bytes = Path(pdf_path).read_bytes()
+    except OSError as e:
+        return _error_result(f"Error extracting text: {str(e)}")
+
+    digest = hashlib.sha256(pdf_bytes).hexdigest()
+    cached = load_cached_result(digest)
+    if cached is not None:
+        return cached
+
     # Extract text from PDF
-    text = extract_text_from_pdf(pdf_path)
+    text = extract_text_from_pdf(BytesIO(pdf_bytes))
 
     if text.startswith("Error"):
-        return {
-            "error": text,
-            "text": "",
-            "skills": [],
-            "keywords": [],
-            "experience": [],
-            "location": None,
-            "yearsExperience": 0
-        }
-
-    # Extract structured data
-    skills = extract_skills(text)
-    keywords = extract_keywords(text)
+        return _error_result(text)
+
+    # Extract structured data, lowercasing the full text only once
+    text_lower = text.lower()
+    skills = extract_skills(text, text_lower)
+    keywords = extract_keywords(text, text_lower)
     experiences = extract_experience(text)
     location = extract_location(text)
     years_exp = calculate_years_of_experience(experiences)
 
-    return {
-        "text": text[:5000],  # First 5000 chars for preview
+    # Only the preview is returned and cached; release the full text now
+    preview = text[:5000]  # First 5000 chars for preview
+    del text, text_lower
+
+    result = {
+        "text": preview,
         "skills": skills,
         "keywords": keywords,
         "experience": experiences,
@@ -232,30 +313,55 @@ def parse_resume(pdf_path: str) -> Dict:
         "yearsExperience": years_exp
     }
 
+    save_cached_result(digest, result)
+    return result
+
+
+def handle_request(input_data: Dict) -> Dict:
+    """Dispatch a single JSON request to the matching action"""
+    action = input_data.get('action')
+
+    if action == 'parse':
+        pdf_path = input_data.get('pdf_path')
+        if not pdf_path or not Path(pdf_path).exists():
+            return {"error": "PDF file not found"}
+        return parse_resume(pdf_path)
+
+    return {"error": f"Unknown action: {action}"}
+
+
+def serve():
+    """
+    Persistent mode: read one JSON request per stdin line and write one JSON
+    result per stdout line, so the interpreter and imports are paid for once.
+    """
+    for line in sys.stdin.buffer:
+        if not line.strip():
+            continue
+        try:
+            result = handle_request(json_loads(line))
+        except Exception as e:
+            result = {"error": str(e)}
+
+        write_result(result)
+
 
 def main():
     """Main entry point when called from Swift"""
+    if '--server' in sys.argv[1:]:
+        serve()
+        return
+
     try:
         # Read input from stdin (JSON)
-        input_data = json.loads(sys.stdin.read())
-
-        action = input_data.get('action')
-
-        if action == 'parse':
-            pdf_path = input_data.get('pdf_path')
-            if not pdf_path or not Path(pdf_path).exists():
-                result = {"error": "PDF file not found"}
-            else:
-                result = parse_resume(pdf_path)
-        else:
-            result = {"error": f"Unknown action: {action}"}
+        result = handle_request(json_loads(sys.stdin.buffer.read()))
 
         # Write output to stdout (JSON)
-        print(json.dumps(result))
+        write_result(result)
 
     except Exception as e:
         error_result = {"error": str(e)}
-        print(json.dumps(error_result))
+        write_result(error_result)
         sys.exit(1)
 
 
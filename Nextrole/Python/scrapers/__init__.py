@@ -2,21 +2,46 @@
 """
 Scraper Orchestration Module
 Coordinates scraping across all job boards
+
+The scrapers import the shared JSON and cache helpers from the top-level
+io_utils module, so the scripts directory (Nextrole/Python) must be on
+sys.path: it is when running job_search.py, and PythonBridge sets
+PYTHONPATH to it. resume_parser.py uses io_utils too and stays clear of
+this package, which takes several times longer to import.
 """
 
+import heapq
 import json
+import os
 import sys
 from typing import List, Dict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit, urlunsplit
 
 # Import individual scrapers
 from .linkedin_scraper import LinkedInScraper
 from .indeed_scraper import IndeedScraper
 from .greenhouse_scraper import GreenhouseScraper
 from .workday_scraper import WorkdayScraper
+from .japandev_scraper import JapanDevScraper
 
 # Import matching engine from same folder
-from .matcher import calculate_match_score
+from .matcher import calculate_match_breakdowns, calculate_title_prior
+
+# Every job board, in dispatch order; placeholders are skipped
+SCRAPER_CLASSES = (
+    LinkedInScraper,
+    IndeedScraper,
+    GreenhouseScraper,
+    WorkdayScraper,
+    JapanDevScraper,
+)
+
+# Query parameters that only track where a click came from
+TRACKING_PARAM_PREFIXES = ('utm_', 'refid=', 'trackingid=', 'trk=')
+
+# How many candidates per requested result get a full match score
+PRIOR_CANDIDATES_FACTOR = 2
 
 
 def search_all_boards(resume_data: Dict, filters: Dict) -> Dict:
@@ -31,11 +56,11 @@ def search_all_boards(resume_data: Dict, filters: Dict) -> Dict:
     Returns:
         Dictionary with 'jobs' list and 'errors' list
     """
+    scraping_level = filters.get('scrapingLevel', 'normal')
     scrapers = [
-        LinkedInScraper(filters.get('scrapingLevel', 'normal')),
-        IndeedScraper(filters.get('scrapingLevel', 'normal')),
-        GreenhouseScraper(filters.get('scrapingLevel', 'normal')),
-        WorkdayScraper(filters.get('scrapingLevel', 'normal')),
+        scraper_class(scraping_level)
+        for scraper_class in SCRAPER_CLASSES
+        if scraper_class.IS_IMPLEMENTED
     ]
 
     all_jobs = []
@@ -46,8 +71,11 @@ def search_all_boards(resume_data: Dict, filters: Dict) -> Dict:
     total_scrapers = len(scrapers)
     completed_scrapers = 0
 
-    # Run scrapers in parallel
-    with ThreadPoolExecutor(max_workers=4) as executor:
+    # Run scrapers in parallel: one thread per scraper, since they are I/O bound,
+    # unless the caller caps it with 'maxWorkers'
+    max_workers = filters.get('maxWorkers') or min(total_scrapers, (os.cpu_count() or 2) * 5)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit all scraper tasks
         future_to_scraper = {
             executor.submit(
@@ -81,25 +109,44 @@ def search_all_boards(resume_data: Dict, filters: Dict) -> Dict:
 
                 completed_scrapers += 1
 
-    # Calculate match scores
-    log_progress("Calculating match scores...", 0.85)
-    for job in all_jobs:
-        score = calculate_match_score(resume_data, job)
-        job['matchScore'] = score
-
-    # Deduplicate jobs (same URL or title+company)
-    log_progress("Deduplicating results...", 0.90)
+    # Deduplicate jobs (same URL or title+company) before scoring,
+    # so cross-board duplicates never reach the matcher
+    log_progress("Deduplicating results...", 0.85)
     unique_jobs = deduplicate_jobs(all_jobs)
 
-    # Sort by match score
-    unique_jobs.sort(key=lambda j: j.get('matchScore', 0.0), reverse=True)
-
-    # Apply filters
-    log_progress("Applying filters...", 0.95)
+    # Apply filters (none of them depend on the match score)
+    log_progress("Applying filters...", 0.90)
     filtered_jobs = apply_filters(unique_jobs, filters, resume_data)
 
+    # Only the best 2 * max_results candidates by a cheap title/tech-stack
+    # prior get the full description-based score. The cut is made only when
+    # more jobs than that have a nonzero prior; otherwise it would fall among
+    # jobs tied at 0.0 by arrival order, dropping strong description matches
+    candidate_limit = max_results * PRIOR_CANDIDATES_FACTOR
+    if len(filtered_jobs) > candidate_limit and resume_data.get('skills'):
+        priors = [calculate_title_prior(resume_data, job) for job in filtered_jobs]
+        if sum(1 for prior in priors if prior > 0) > candidate_limit:
+            top = heapq.nlargest(candidate_limit, range(len(filtered_jobs)), key=priors.__getitem__)
+            filtered_jobs = [filtered_jobs[i] for i in top]
+
+    # Calculate match scores with breakdown, dropping jobs below the minimum score
+    # so they never reach the ranking
+    log_progress("Calculating match scores...", 0.95)
+    min_score = filters.get('minimumMatchScore', 0.0)
+    scored_jobs = []
+    breakdowns = calculate_match_breakdowns(resume_data, filtered_jobs)
+    for job, breakdown in zip(filtered_jobs, breakdowns):
+        job['matchScore'] = breakdown['totalScore']
+        job['matchBreakdown'] = breakdown
+        if job['matchScore'] >= min_score:
+            scored_jobs.append(job)
+
+    # Keep the best max_results matches, best first; a bounded heap
+    # avoids sorting every result when only the top ones are returned
+    scored_jobs = heapq.nlargest(max_results, scored_jobs, key=lambda j: j.get('matchScore', 0.0))
+
     return {
-        "jobs": filtered_jobs,
+        "jobs": scored_jobs,
         "errors": errors
     }
 
@@ -114,67 +161,88 @@ def run_scraper(
 ) -> List[Dict]:
     """Run a single scraper and return results"""
     source_name = scraper.get_source_name()
+    sys.stderr.write(f"Starting {source_name} scraper...\n")
+    sys.stderr.flush()
     log_progress(f"Searching {source_name}...", 0.0)
 
-    jobs = scraper.search(
-        keywords=keywords,
-        location=location,
-        remote_only=remote_only,
-        posted_within_days=posted_within_days,
-        max_results=max_results
-    )
+    try:
+        jobs = scraper.search(
+            keywords=keywords,
+            location=location,
+            remote_only=remote_only,
+            posted_within_days=posted_within_days,
+            max_results=max_results
+        )
+    finally:
+        scraper.flush_logs()
+
+    sys.stderr.write(f"{source_name} returned {len(jobs)} jobs\n")
+    sys.stderr.flush()
 
     return jobs
 
 
 def deduplicate_jobs(jobs: List[Dict]) -> List[Dict]:
-    """Remove duplicate job postings"""
-    seen_urls = set()
-    seen_title_company = set()
-    unique_jobs = []
+    """
+    Remove duplicate job postings.
+
+    Jobs are keyed by canonical URL, or by title+company when there is no URL,
+    and the first posting seen for each key wins.
+    """
+    seen: Dict[str, Dict] = {}
 
     for job in jobs:
-        url = job.get('url', '')
-        title_company = (job.get('title', '').lower(), job.get('company', '').lower())
+        key = canonicalize_url(job.get('url', ''))
+        if not key:
+            key = f"{job.get('title', '').casefold()}|{job.get('company', '').casefold()}"
+        seen.setdefault(key, job)
 
-        if url and url not in seen_urls:
-            seen_urls.add(url)
-            seen_title_company.add(title_company)
-            unique_jobs.append(job)
-        elif title_company not in seen_title_company:
-            seen_title_company.add(title_company)
-            unique_jobs.append(job)
+    return list(seen.values())
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a job URL so tracking variants of the same posting compare equal"""
+    if not url:
+        return ''
+
+    parts = urlsplit(url.strip())
+    query = '&'.join(
+        param for param in parts.query.split('&')
+        if param and not param.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
 
-    return unique_jobs
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), query, ''))
 
 
 def apply_filters(jobs: List[Dict], filters: Dict, resume_data: Dict) -> List[Dict]:
-    """Apply user filters to job results"""
-    filtered = jobs
-
-    # Filter by minimum match score
-    min_score = filters.get('minimumMatchScore', 0.5)
-    filtered = [j for j in filtered if j.get('matchScore', 0.0) >= min_score]
-
-    # Filter by tech stack
-    tech_filter = filters.get('techStack', [])
-    if tech_filter:
-        filtered = [
-            j for j in filtered
-            if any(tech.lower() in j.get('description', '').lower() for tech in tech_filter)
-        ]
-
-    # Filter by visa sponsorship
-    if filters.get('visaSponsorship'):
-        filtered = [j for j in filtered if j.get('visaSponsorship') == True]
-
-    # Filter by company type
-    company_types = filters.get('companyTypes', [])
-    if company_types and company_types != []:
-        filtered = [
-            j for j in filtered
-            if j.get('companySize') in company_types or not j.get('companySize')
-        ]
+    """Apply user filters to job results in a single pass"""
+    # Hoist filter settings out of the per-job loop
+    tech_filter = [tech.lower() for tech in filters.get('techStack', [])]
+    visa_only = filters.get('visaSponsorship')
+    company_types = set(filters.get('companyTypes', []))
+
+    if not (tech_filter or visa_only or company_types):
+        return jobs
+
+    filtered = []
+    for j in jobs:
+        # Filter by tech stack
+        if tech_filter:
+            description = j.get('description', '').lower()
+            if not any(tech in description for tech in tech_filter):
+                continue
+
+        # Filter by visa sponsorship
+        if visa_only and j.get('visaSponsorship') != True:
+            continue
+
+        # Filter by company type
+        if company_types:
+            company_size = j.get('companySize')
+            if company_size and company_size not in company_types:
+                continue
+
+        filtered.append(j)
 
     return filtered
 
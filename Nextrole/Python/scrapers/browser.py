@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Shared Browser
+Keeps one headless Chromium alive for the whole process.
+
+Playwright objects are bound to the event loop that created them, so the
+browser lives on a dedicated background loop. Scrapers submit their async
+work to it with run() and open a fresh context per search, which keeps
+Chromium's start-up cost to once per process instead of once per search.
+"""
+
+import asyncio
+import atexit
+import threading
+from typing import Optional
+
+from playwright.async_api import async_playwright, Browser, Playwright, Route
+
+
+# Chromium flags for headless scraping
+LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--no-sandbox',
+]
+
+# Requests that never affect the rendered job listings
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'stylesheet', 'media'})
+BLOCKED_URL_PARTS = (
+    'google-analytics', 'googletagmanager', 'doubleclick',
+    'segment', 'hotjar', 'sentry', 'facebook.net',
+)
+
+# Seconds to wait for the browser to shut down at exit
+CLOSE_TIMEOUT = 10
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+# Only touched from the browser loop
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+_browser_lock: Optional[asyncio.Lock] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the browser event loop, starting its thread on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="browser-loop", daemon=True)
+            thread.start()
+            _loop = loop
+            atexit.register(close)
+        return _loop
+
+
+def run(coro):
+    """Run a coroutine on the browser loop and block until it finishes"""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+async def get_browser() -> Browser:
+    """Return the shared browser, launching it on first use (call via run())"""
+    global _playwright, _browser, _browser_lock
+    if _browser_lock is None:
+        _browser_lock = asyncio.Lock()
+
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True, args=LAUNCH_ARGS)
+
+    return _browser
+
+
+async def block_heavy_resources(route: Route):
+    """Route handler that aborts images, fonts, CSS, media and analytics"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        part in request.url for part in BLOCKED_URL_PARTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def aclose():
+    """Close the shared browser and stop Playwright"""
+    global _playwright, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
+
+
+def close():
+    """Shut down the shared browser, if one was started"""
+    if _loop is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(aclose(), _loop).result(timeout=CLOSE_TIMEOUT)
+    except Exception:
+        pass  # Best effort at exit; Chromium dies with the process anyway
@@ -4,10 +4,49 @@ Greenhouse Job Scraper
 Scrapes job postings from Greenhouse boards
 """
 
-from typing import List, Dict, Optional
-import requests
+import asyncio
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+
+import httpx
+
+from io_utils import json_loads, write_cache_file
+
 from .base_scraper import BaseScraper
 
+# Raw board payloads are cached on disk for a few minutes, so repeated or
+# refined searches (each run in a fresh process) don't refetch every board
+BOARD_CACHE_DIR = Path.home() / '.cache' / 'nextrole' / 'greenhouse'
+BOARD_CACHE_TTL = 300  # seconds
+
+
+def load_cached_board(company: str) -> Optional[bytes]:
+    """Return a company's board payload if it was fetched within the TTL"""
+    path = _board_cache_path(company)
+    try:
+        if time.time() - path.stat().st_mtime < BOARD_CACHE_TTL:
+            return path.read_bytes()
+    except OSError:
+        pass
+    return None
+
+
+def save_cached_board(company: str, content: bytes, data) -> None:
+    """
+    Write a board payload to the cache.
+
+    data is the decoded content; anything but a boards API response (an
+    HTML maintenance page, a truncated body) is not cached.
+    """
+    if isinstance(data, dict) and 'jobs' in data:
+        write_cache_file(_board_cache_path(company), content)
+
+
+def _board_cache_path(company: str) -> Path:
+    return BOARD_CACHE_DIR / f"{company}.json"
+
 
 class GreenhouseScraper(BaseScraper):
     """Scraper for Greenhouse job boards"""
@@ -20,6 +59,10 @@ class GreenhouseScraper(BaseScraper):
         'datadog', 'cloudflare', 'elastic', 'hashicorp', 'mongodb'
     ]
 
+    # Boards fetched at once. The boards API is a public JSON endpoint, so
+    # concurrency is bounded here rather than spacing requests out
+    MAX_CONCURRENT_BOARDS = 8
+
     def get_source_name(self) -> str:
         return "Greenhouse"
 
@@ -37,14 +80,48 @@ class GreenhouseScraper(BaseScraper):
         try:
             self.log_progress(f"Searching {len(self.KNOWN_COMPANIES)} Greenhouse boards...", 0.1)
 
-            for idx, company in enumerate(self.KNOWN_COMPANIES):
-                try:
-                    jobs = self.scrape_company_board(
-                        company,
-                        keywords,
-                        location,
-                        remote_only
-                    )
+            all_jobs = asyncio.run(
+                self._search_async(keywords, location, remote_only, max_results)
+            )
+
+            self.log_progress(f"Greenhouse search complete: {len(all_jobs)} jobs", 0.9)
+
+        except Exception as e:
+            self.log_progress(f"Greenhouse search failed: {str(e)}", 0.0)
+
+        return all_jobs[:max_results]
+
+    async def _search_async(
+        self,
+        keywords: List[str],
+        location: Optional[str],
+        remote_only: bool,
+        max_results: int
+    ) -> List[Dict]:
+        """Fetch all company boards concurrently, stopping once max_results is reached"""
+        all_jobs = []
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_BOARDS)
+
+        async with self.async_client() as client:
+            tasks = [
+                asyncio.ensure_future(self._fetch_company_board_async(client, semaphore, company))
+                for company in self.KNOWN_COMPANIES
+            ]
+
+            try:
+                for idx, next_board in enumerate(asyncio.as_completed(tasks)):
+                    company, data = await next_board
+
+                    # Parse only as many matches as the search still needs
+                    jobs = []
+                    if data is not None:
+                        try:
+                            jobs = self.parse_company_board(
+                                company, data, keywords, location, remote_only,
+                                limit=max_results - len(all_jobs)
+                            )
+                        except Exception:
+                            pass  # Unexpected board payload
                     all_jobs.extend(jobs)
 
                     # Update progress
@@ -53,75 +130,139 @@ class GreenhouseScraper(BaseScraper):
 
                     if len(all_jobs) >= max_results:
                         break
+            finally:
+                # Stop boards still in flight once we have enough results
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
 
-                except Exception as e:
-                    self.log_progress(f"Error scraping {company}: {str(e)}", 0.0)
-                    continue
+        return all_jobs
 
-            self.log_progress(f"Greenhouse search complete: {len(all_jobs)} jobs", 0.9)
-
-        except Exception as e:
-            self.log_progress(f"Greenhouse search failed: {str(e)}", 0.0)
+    async def _fetch_company_board_async(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        company: str
+    ) -> Tuple[str, Optional[Dict]]:
+        """Fetch a single company's Greenhouse board; data is None if it failed"""
+        try:
+            content = load_cached_board(company)
+            if content is None:
+                async with semaphore:
+                    response = await self.make_request_async(
+                        client, self.board_url(company), throttle=False
+                    )
+                content = response.content
+                # Decoded in one go: without ?content=true the payload is small,
+                # and orjson on the whole body beats a streaming parser
+                data = json_loads(content)
+                save_cached_board(company, content, data)
+            else:
+                data = json_loads(content)
+            return company, data
+        except Exception:
+            return company, None  # Company board doesn't exist or API failed
 
-        return all_jobs[:max_results]
+    def board_url(self, company: str) -> str:
+        """Greenhouse API endpoint (public) for a company's job board"""
+        return f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
 
     def scrape_company_board(
         self,
         company: str,
         keywords: List[str],
         location: Optional[str],
-        remote_only: bool
+        remote_only: bool,
+        limit: Optional[int] = None
     ) -> List[Dict]:
-        """Scrape a single company's Greenhouse board"""
+        """Scrape a single company's Greenhouse board (at most limit jobs)"""
         jobs = []
 
         try:
-            # Greenhouse API endpoint (public)
-            api_url = f"https://boards-api.greenhouse.io/v1/boards/{company}/jobs"
-
-            response = self.make_request(api_url)
-            data = response.json()
-
-            # Parse jobs from API response
-            for job_data in data.get('jobs', []):
-                # Filter by keywords
-                if keywords:
-                    title = job_data.get('title', '').lower()
-                    if not any(kw.lower() in title for kw in keywords):
-                        continue
-
-                # Filter by location
-                job_location = job_data.get('location', {}).get('name', '')
-                if remote_only and 'remote' not in job_location.lower():
-                    continue
+            content = load_cached_board(company)
+            if content is None:
+                content = self.make_request(self.board_url(company)).content
+                data = json_loads(content)
+                save_cached_board(company, content, data)
+            else:
+                data = json_loads(content)
+            jobs = self.parse_company_board(company, data, keywords, location, remote_only, limit)
+
+        except Exception as e:
+            pass  # Company board doesn't exist or API failed
+
+        return jobs
 
-                if location and location.lower() not in job_location.lower() and 'remote' not in job_location.lower():
+    def parse_company_board(
+        self,
+        company: str,
+        data: Dict,
+        keywords: List[str],
+        location: Optional[str],
+        remote_only: bool,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Filter and convert a board's API response into job dictionaries.
+
+        Stops after limit matching jobs, so large boards aren't fully
+        converted when the search only needs a few more results.
+        """
+        jobs = []
+        if limit is not None and limit <= 0:
+            return jobs
+
+        # Loop invariants: computed once per board rather than once per job
+        keywords_lower = tuple(kw.lower() for kw in keywords or ())
+        location_lower = location.lower() if location else None
+        company_name = company.title()
+        source = self.get_source_name()
+        now = datetime.now().isoformat()
+
+        # Parse jobs from API response; the title filter runs first so
+        # non-matching jobs never have their other fields read
+        for job_data in data.get('jobs', []):
+            title = job_data.get('title', '')
+
+            # Filter by keywords
+            if keywords_lower:
+                title_lower = title.lower()
+                if not any(kw in title_lower for kw in keywords_lower):
                     continue
 
-                # Parse job - use updated_at if available, fallback to current time
-                from datetime import datetime
-                posted_date = job_data.get('updated_at') or datetime.now().isoformat()
-
-                job = {
-                    "title": job_data.get('title', ''),
-                    "company": company.title(),
-                    "location": job_location,
-                    "description": job_data.get('content', ''),
-                    "url": job_data.get('absolute_url', ''),
-                    "source": self.get_source_name(),
-                    "postedDate": posted_date,
-                    "isRemote": 'remote' in job_location.lower(),
-                    "offersRelocation": False,
-                    "matchScore": 0.0,
-                    "techStack": self.extract_tech_stack(job_data.get('content', '')),
-                    "salaryRange": None,
-                    "visaSponsorship": None,
-                    "companySize": None
-                }
-
-                jobs.append(job)
+            # Filter by location
+            job_location = job_data.get('location', {}).get('name', '')
+            job_location_lower = job_location.lower()
+            is_remote = 'remote' in job_location_lower
+            if remote_only and not is_remote:
+                continue
 
-        except Exception as e:
-            pass  # Company board doesn't exist or API failed
+            if location_lower and location_lower not in job_location_lower and not is_remote:
+                continue
+
+            # Parse job - use updated_at if available, fallback to current time
+            posted_date = job_data.get('updated_at') or now
+            content = job_data.get('content', '')
+
+            job = {
+                "title": title,
+                "company": company_name,
+                "location": job_location,
+                "description": content,
+                "url": job_data.get('absolute_url', ''),
+                "source": source,
+                "postedDate": posted_date,
+                "isRemote": is_remote,
+                "offersRelocation": False,
+                "matchScore": 0.0,
+                "techStack": self.extract_tech_stack(content),
+                "salaryRange": None,
+                "visaSponsorship": None,
+                "companySize": None
+            }
+
+            jobs.append(job)
+            if limit is not None and len(jobs) >= limit:
+                break
 
         return jobs
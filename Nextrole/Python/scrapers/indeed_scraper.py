@@ -4,10 +4,14 @@ Indeed Job Scraper
 Scrapes job postings from Indeed.com
 """
 
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+import asyncio
+from typing import List, Dict, Optional, Tuple
 from urllib.parse import quote_plus
-from .base_scraper import BaseScraper
+
+import httpx
+import lxml.html
+
+from .base_scraper import BaseScraper, css, element_text, select_first, select_one
 
 
 class IndeedScraper(BaseScraper):
@@ -15,6 +19,26 @@ class IndeedScraper(BaseScraper):
 
     BASE_URL = "https://www.indeed.com"
 
+    # Job card layouts, tried in order
+    CARD_SELECTORS = (
+        css('div.job_seen_beacon'),
+        css('div.jobsearch-SerpJobCard'),
+        css('a.jcs-JobTitle'),
+    )
+
+    TITLE_SELECTORS = (css('h2.jobTitle'), css('a.jcs-JobTitle'))
+    COMPANY_SELECTOR = css('span.companyName')
+    LOCATION_SELECTOR = css('div.companyLocation')
+    LINK_SELECTOR = css('a')
+    SNIPPET_SELECTOR = css('div.job-snippet')
+    DATE_SELECTOR = css('span.date')
+
+    # Indeed pages results via &start=N; the rate limiter spaces the page
+    # requests out and at most MAX_CONCURRENT_PAGES are in flight at once
+    RESULTS_PER_PAGE = 10
+    MAX_PAGES = 5
+    MAX_CONCURRENT_PAGES = 3
+
     def get_source_name(self) -> str:
         return "Indeed"
 
@@ -62,30 +86,7 @@ class IndeedScraper(BaseScraper):
 
             self.log_progress(f"Searching Indeed for '{query}'...", 0.1)
 
-            # Make request
-            response = self.make_request(search_url)
-            soup = BeautifulSoup(response.text, 'lxml')
-
-            # Find job cards
-            job_cards = soup.find_all('div', class_='job_seen_beacon') or \
-                       soup.find_all('div', class_='jobsearch-SerpJobCard') or \
-                       soup.find_all('a', class_='jcs-JobTitle')
-
-            self.log_progress(f"Found {len(job_cards)} job cards", 0.3)
-
-            for idx, card in enumerate(job_cards[:max_results]):
-                try:
-                    job = self.parse_job_card(card)
-                    if job:
-                        jobs.append(job)
-
-                    # Update progress
-                    progress = 0.3 + (idx / min(len(job_cards), max_results)) * 0.6
-                    self.log_progress(f"Parsed {idx+1}/{len(job_cards)} jobs", progress)
-
-                except Exception as e:
-                    self.log_progress(f"Error parsing job card: {str(e)}", 0.0)
-                    continue
+            jobs = asyncio.run(self._search_async(search_url, max_results))
 
             self.log_progress(f"Completed Indeed search: {len(jobs)} jobs", 0.9)
 
@@ -95,41 +96,112 @@ class IndeedScraper(BaseScraper):
 
         return jobs
 
+    async def _search_async(self, search_url: str, max_results: int) -> List[Dict]:
+        """Fetch the result pages concurrently and merge them in page order"""
+        pages = min(self.MAX_PAGES, max(1, -(-max_results // self.RESULTS_PER_PAGE)))
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PAGES)
+
+        async with self.async_client() as client:
+            results = await asyncio.gather(
+                *(self._fetch_page(client, semaphore, search_url, page) for page in range(pages)),
+                return_exceptions=True
+            )
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if len(errors) == len(results):
+            raise errors[0]
+
+        jobs = []
+        for page, result in enumerate(results):
+            if isinstance(result, BaseException):
+                self.log_progress(f"Error fetching page {page + 1}: {str(result)}", 0.0)
+                continue
+            card_count, page_jobs = result
+            jobs.extend(page_jobs)
+            self.log_progress(
+                f"Parsed {len(page_jobs)}/{card_count} jobs from page {page + 1}",
+                0.3 + 0.6 * (page + 1) / pages
+            )
+
+        return jobs[:max_results]
+
+    async def _fetch_page(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        search_url: str,
+        page: int
+    ) -> Tuple[int, List[Dict]]:
+        """Fetch one result page and parse it off the event loop"""
+        url = search_url
+        if page:
+            url += f"&start={page * self.RESULTS_PER_PAGE}"
+
+        async with semaphore:
+            response = await self.make_request_async(client, url)
+
+        # Parse in a worker thread so other pages keep downloading meanwhile
+        return await asyncio.to_thread(self.parse_results_page, response.content)
+
+    def parse_results_page(self, html: bytes) -> Tuple[int, List[Dict]]:
+        """Parse a result page; returns (job card count, parsed jobs)"""
+        # Parsed whole rather than with a pull parser: a page holds only
+        # RESULTS_PER_PAGE cards, and which card layout applies is only
+        # known once CARD_SELECTORS have been tried against the full tree
+        tree = lxml.html.fromstring(html)
+
+        # Find job cards
+        job_cards = []
+        for selector in self.CARD_SELECTORS:
+            job_cards = selector(tree)
+            if job_cards:
+                break
+
+        jobs = []
+        for card in job_cards:
+            try:
+                job = self.parse_job_card(card)
+                if job:
+                    jobs.append(job)
+            except Exception:
+                continue
+
+        return len(job_cards), jobs
+
     def parse_job_card(self, card) -> Optional[Dict]:
         """Parse a single job card"""
         try:
             # Extract title
-            title_elem = card.find('h2', class_='jobTitle') or \
-                        card.find('a', class_='jcs-JobTitle')
+            title_elem = select_first(self.TITLE_SELECTORS, card)
 
-            if not title_elem:
+            if title_elem is None:
                 return None
 
-            title = title_elem.get_text(strip=True)
+            title = element_text(title_elem, strip=True)
 
             # Extract company
-            company_elem = card.find('span', class_='companyName')
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
+            company_elem = select_one(self.COMPANY_SELECTOR, card)
+            company = element_text(company_elem, strip=True) if company_elem is not None else "Unknown Company"
 
             # Extract location
-            location_elem = card.find('div', class_='companyLocation')
-            location = location_elem.get_text(strip=True) if location_elem else "Unknown Location"
+            location_elem = select_one(self.LOCATION_SELECTOR, card)
+            location = element_text(location_elem, strip=True) if location_elem is not None else "Unknown Location"
 
             # Determine if remote
             is_remote = 'remote' in location.lower()
 
             # Extract job URL
-            link_elem = title_elem.find('a') if title_elem.name != 'a' else title_elem
-            job_id = link_elem.get('data-jk', '') if link_elem else ''
+            link_elem = select_one(self.LINK_SELECTOR, title_elem) if title_elem.tag != 'a' else title_elem
+            job_id = link_elem.get('data-jk', '') if link_elem is not None else ''
             job_url = f"{self.BASE_URL}/viewjob?jk={job_id}" if job_id else f"{self.BASE_URL}/jobs"
 
             # Extract snippet/description
-            snippet_elem = card.find('div', class_='job-snippet')
-            description = snippet_elem.get_text(strip=True) if snippet_elem else ""
+            snippet_elem = select_one(self.SNIPPET_SELECTOR, card)
+            description = element_text(snippet_elem, strip=True) if snippet_elem is not None else ""
 
             # Extract posted date
-            date_elem = card.find('span', class_='date')
-            posted_date_str = date_elem.get_text(strip=True) if date_elem else "Unknown"
+            date_elem = select_one(self.DATE_SELECTOR, card)
+            posted_date_str = element_text(date_elem, strip=True) if date_elem is not None else "Unknown"
             posted_date = self.parse_relative_date(posted_date_str)
 
             # Extract tech stack from description
@@ -4,20 +4,20 @@ Japan Dev Job Scraper
 Scrapes job postings from japan-dev.com for tech jobs in Japan.
 
 Uses Playwright for browser automation since Japan Dev uses
-Algolia InstantSearch for client-side rendering.
+Algolia InstantSearch for client-side rendering. The browser is shared
+across searches (see browser.py); each search gets its own context.
 """
 
-import asyncio
 import random
 import sys
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+from playwright.async_api import Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
+import lxml.html
 
-from .base_scraper import BaseScraper, RateLimiter
+from . import browser
+from .base_scraper import USER_AGENTS, BaseScraper, RateLimiter, css, element_text, select_first, select_one
 
 
 class JapanDevScraper(BaseScraper):
@@ -36,6 +36,43 @@ class JapanDevScraper(BaseScraper):
     # Jobs per page (approximate)
     JOBS_PER_PAGE = 20
 
+    # Rendered job items, and how long to wait for more after each scroll
+    JOB_ITEM_CSS = '.job-item, .ais-Hits-item'
+
+    # Serialises just the job items (first layout that matches, as with
+    # CARD_SELECTORS) so the rest of the page never crosses the CDP wire
+    JOB_ITEMS_HTML_JS = """() => {
+        for (const selector of ['.job-item', '.ais-Hits-item']) {
+            const items = document.querySelectorAll(selector);
+            if (items.length) {
+                return Array.from(items, item => item.outerHTML).join('');
+            }
+        }
+        return '';
+    }"""
+    MAX_SCROLLS = 3
+    SCROLL_WAIT_MS = 2000
+
+    # Contexts are pooled across searches so the site's scripts stay in their
+    # HTTP cache; each is retired after CONTEXT_MAX_USES searches so the
+    # user agent still rotates
+    MAX_IDLE_CONTEXTS = 2
+    CONTEXT_MAX_USES = 20
+
+    # (context, searches served); only touched from the browser loop
+    _idle_contexts: List[Tuple[BrowserContext, int]] = []
+
+    # Job card layouts, tried in order
+    CARD_SELECTORS = (css('.job-item'), css('.ais-Hits-item'), css('[class*="job"]'))
+
+    # Card fields, each with fallbacks tried in order
+    TITLE_SELECTORS = (css('h2'), css('h3'), css('[class*="title"]'), css('a'))
+    COMPANY_SELECTORS = (css('[class*="company"]'), css('.text-gray-600'), css('span'))
+    LOCATION_SELECTOR = css('[class*="location"]')
+    LINK_SELECTORS = (css('a[href*="/jobs/"]'), css('a'))
+    DESCRIPTION_SELECTORS = (css('[class*="description"]'), css('p'))
+    TAG_SELECTOR = css('.bubble, .tag, [class*="badge"]')
+
     def __init__(self, scraping_level: str = "normal"):
         """Initialize Japan Dev scraper."""
         super().__init__(scraping_level)
@@ -69,19 +106,7 @@ class JapanDevScraper(BaseScraper):
             List of job dictionaries
         """
         try:
-            if sys.platform == 'win32':
-                asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            try:
-                jobs = loop.run_until_complete(
-                    self._async_search(keywords, remote_only, max_results)
-                )
-                return jobs
-            finally:
-                loop.close()
+            return browser.run(self._async_search(keywords, remote_only, max_results))
 
         except Exception as e:
             self.log_progress(f"JapanDev error: {str(e)}", 0.0)
@@ -97,32 +122,31 @@ class JapanDevScraper(BaseScraper):
         jobs = []
 
         try:
-            self.log_progress("Initializing JapanDev scraper...", 0.05)
+            self.log_progress("Initializing JapanDev scraper...", 0.05, flush=True)
 
-            async with async_playwright() as playwright:
-                self.browser = await self._init_browser(playwright)
-                self.context = await self._create_context()
-                page = await self.context.new_page()
+            # Reuse the process-wide browser and, when one is idle, a context
+            self.browser = await browser.get_browser()
+            self.context, context_uses = await self._acquire_context()
+            page = await self.context.new_page()
 
-                try:
-                    # Build search URL
-                    search_url = self._build_search_url(keywords, remote_only)
+            try:
+                # Build search URL
+                search_url = self._build_search_url(keywords, remote_only)
 
-                    self.log_progress(f"Searching JapanDev...", 0.1)
+                self.log_progress(f"Searching JapanDev...", 0.1, flush=True)
 
-                    # Navigate and scrape
-                    page_jobs = await self._scrape_page(page, search_url)
+                # Navigate and scrape
+                page_jobs = await self._scrape_page(page, search_url)
 
-                    if page_jobs:
-                        jobs.extend(page_jobs)
-                        self.log_progress(f"JapanDev: Found {len(page_jobs)} jobs", 0.8)
+                if page_jobs:
+                    jobs.extend(page_jobs)
+                    self.log_progress(f"JapanDev: Found {len(page_jobs)} jobs", 0.8)
 
-                    self.log_progress(f"JapanDev scraping complete: {len(jobs)} jobs", 0.9)
+                self.log_progress(f"JapanDev scraping complete: {len(jobs)} jobs", 0.9)
 
-                finally:
-                    await page.close()
-                    await self.context.close()
-                    await self.browser.close()
+            finally:
+                await page.close()
+                await self._release_context(self.context, context_uses)
 
         except Exception as e:
             self.log_progress(f"JapanDev fatal error: {str(e)}", 0.0)
@@ -132,25 +156,27 @@ class JapanDevScraper(BaseScraper):
 
         return jobs[:max_results]
 
-    async def _init_browser(self, playwright) -> Browser:
-        """Initialize browser with anti-detection settings."""
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--no-sandbox',
-            ]
-        )
-        return browser
+    async def _acquire_context(self) -> Tuple[BrowserContext, int]:
+        """Check out an idle context on the current browser, or create one."""
+        while self._idle_contexts:
+            context, uses = self._idle_contexts.pop()
+            # Contexts from before a browser relaunch died with that browser
+            if context.browser is self.browser:
+                return context, uses
+        return await self._create_context(), 0
+
+    async def _release_context(self, context: BrowserContext, uses: int):
+        """Return a context to the pool, or close it once it is used up."""
+        uses += 1
+        if uses < self.CONTEXT_MAX_USES and len(self._idle_contexts) < self.MAX_IDLE_CONTEXTS:
+            self._idle_contexts.append((context, uses))
+        else:
+            await context.close()
 
     async def _create_context(self) -> BrowserContext:
         """Create browser context with realistic fingerprint."""
-        ua = UserAgent()
-
         context = await self.browser.new_context(
-            user_agent=ua.random,
+            user_agent=random.choice(USER_AGENTS),
             viewport={'width': 1920, 'height': 1080},
             locale='en-US',
             timezone_id='Asia/Tokyo',
@@ -161,6 +187,9 @@ class JapanDevScraper(BaseScraper):
             }
         )
 
+        # Job cards come from Algolia JSON; skip everything that only styles the page
+        await context.route("**/*", browser.block_heavy_resources)
+
         return context
 
     def _build_search_url(self, keywords: List[str], remote_only: bool) -> str:
@@ -188,12 +217,14 @@ class JapanDevScraper(BaseScraper):
         jobs = []
 
         try:
-            # Navigate to page
-            await page.goto(url, wait_until='networkidle', timeout=30000)
+            # Navigate to page; return as soon as the response commits, since
+            # the wait for job items below is what actually gates readiness
+            await page.goto(url, wait_until='commit', timeout=30000)
 
-            # Wait for job listings to load (Algolia renders client-side)
+            # Wait for job listings to load (Algolia renders client-side).
+            # This now also covers the document load goto no longer waits for
             try:
-                await page.wait_for_selector('.job-item, .ais-Hits-item', timeout=15000)
+                await page.wait_for_selector(self.JOB_ITEM_CSS, timeout=30000)
             except PlaywrightTimeoutError:
                 self.log_progress("JapanDev: No job items found", 0.0)
                 return []
@@ -201,14 +232,20 @@ class JapanDevScraper(BaseScraper):
             # Scroll to load more content
             await self._scroll_page(page)
 
-            # Get page HTML
-            html = await page.content()
+            # Get the job items' HTML rather than the whole page
+            html = await page.evaluate(self.JOB_ITEMS_HTML_JS)
+            if not html:
+                return []
 
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(html, 'lxml')
+            # Parse with lxml; as a document, so a single item sits below the root
+            tree = lxml.html.document_fromstring(html)
 
             # Find job cards (try multiple selectors)
-            job_cards = soup.select('.job-item') or soup.select('.ais-Hits-item') or soup.select('[class*="job"]')
+            job_cards = []
+            for selector in self.CARD_SELECTORS:
+                job_cards = selector(tree)
+                if job_cards:
+                    break
 
             self.log_progress(f"JapanDev: Parsing {len(job_cards)} job cards...", 0.5)
 
@@ -227,65 +264,79 @@ class JapanDevScraper(BaseScraper):
         return jobs
 
     async def _scroll_page(self, page: Page):
-        """Scroll page to trigger lazy loading."""
+        """
+        Scroll page to trigger lazy loading.
+
+        Waits for new job items to render after each scroll instead of
+        sleeping a fixed time, and stops as soon as a scroll loads nothing.
+        """
+        count_items = f"document.querySelectorAll('{self.JOB_ITEM_CSS}').length"
         try:
-            for _ in range(3):
-                await page.evaluate('window.scrollBy(0, 500)')
-                await asyncio.sleep(0.5)
+            loaded = await page.evaluate(count_items)
+            for _ in range(self.MAX_SCROLLS):
+                await page.evaluate('window.scrollBy(0, document.body.scrollHeight)')
+                try:
+                    await page.wait_for_function(
+                        f"{count_items} > {loaded}", timeout=self.SCROLL_WAIT_MS
+                    )
+                except PlaywrightTimeoutError:
+                    break
+                loaded = await page.evaluate(count_items)
         except Exception:
             pass
 
+    def _text_flags(self, text_lower: str) -> Tuple[bool, bool, bool]:
+        """
+        Return (is_remote, offers_relocation, visa_sponsorship) for lowercased text.
+
+        The shared 'visa' check is done once for both flags.
+        """
+        mentions_visa = 'visa' in text_lower
+        return (
+            'remote' in text_lower,
+            mentions_visa or 'relocation' in text_lower,
+            mentions_visa or 'sponsorship' in text_lower,
+        )
+
     def _parse_job_card(self, card) -> Optional[Dict]:
         """Parse a job card element into a job dictionary."""
         try:
             # Title
-            title_elem = (
-                card.select_one('h2') or
-                card.select_one('h3') or
-                card.select_one('[class*="title"]') or
-                card.select_one('a')
-            )
-            title = title_elem.get_text(strip=True) if title_elem else None
+            title_elem = select_first(self.TITLE_SELECTORS, card)
+            title = element_text(title_elem, strip=True) if title_elem is not None else None
 
             if not title:
                 return None
 
             # Company
-            company_elem = (
-                card.select_one('[class*="company"]') or
-                card.select_one('.text-gray-600') or
-                card.select_one('span')
-            )
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
+            company_elem = select_first(self.COMPANY_SELECTORS, card)
+            company = element_text(company_elem, strip=True) if company_elem is not None else "Unknown Company"
 
             # Location (usually Tokyo, Japan for Japan Dev)
-            location_elem = card.select_one('[class*="location"]')
-            location = location_elem.get_text(strip=True) if location_elem else "Japan"
+            location_elem = select_one(self.LOCATION_SELECTOR, card)
+            location = element_text(location_elem, strip=True) if location_elem is not None else "Japan"
 
             # URL
-            link_elem = card.select_one('a[href*="/jobs/"]') or card.select_one('a')
+            link_elem = select_first(self.LINK_SELECTORS, card)
             url = None
-            if link_elem and link_elem.get('href'):
-                url = link_elem['href']
+            if link_elem is not None and link_elem.get('href'):
+                url = link_elem.get('href')
                 if not url.startswith('http'):
                     url = f"https://japan-dev.com{url}"
 
             if not url:
                 return None
 
-            # Check for remote
-            card_text = card.get_text().lower()
-            is_remote = 'remote' in card_text
+            # Check for remote, relocation and visa mentions
+            card_text = element_text(card).lower()
+            is_remote, offers_relocation, visa_sponsorship = self._text_flags(card_text)
 
             # Description snippet
-            desc_elem = card.select_one('[class*="description"]') or card.select_one('p')
-            description = desc_elem.get_text(strip=True) if desc_elem else ""
+            desc_elem = select_first(self.DESCRIPTION_SELECTORS, card)
+            description = element_text(desc_elem, strip=True) if desc_elem is not None else ""
 
             # Tags/tech stack
-            tags = []
-            tag_elems = card.select('.bubble, .tag, [class*="badge"]')
-            for tag in tag_elems:
-                tags.append(tag.get_text(strip=True))
+            tags = [element_text(tag, strip=True) for tag in self.TAG_SELECTOR(card)]
 
             # Build job dictionary
             job = {
@@ -297,11 +348,11 @@ class JapanDevScraper(BaseScraper):
                 'source': 'JapanDev',
                 'postedDate': datetime.now().isoformat(),  # Japan Dev doesn't show dates on cards
                 'isRemote': is_remote,
-                'offersRelocation': 'relocation' in card_text or 'visa' in card_text,
+                'offersRelocation': offers_relocation,
                 'matchScore': 0.0,
                 'techStack': tags if tags else self.extract_tech_stack(description + " " + title),
                 'salaryRange': None,
-                'visaSponsorship': 'visa' in card_text or 'sponsorship' in card_text,
+                'visaSponsorship': visa_sponsorship,
                 'companySize': None,
             }
 
@@ -1,61 +1,177 @@
 #!/usr/bin/env python3
 """
 LinkedIn Job Scraper
-Scrapes job postings from LinkedIn's public job search using Playwright.
+Scrapes job postings from LinkedIn's public guest job search endpoint.
 
 NOTE: This scraper uses LinkedIn's public job search API without authentication.
-Uses conservative rate limiting to respect LinkedIn's ToS and avoid detection.
+Uses conservative rate limiting to respect LinkedIn's ToS and avoid detection:
+requests start several seconds apart and only speed up while LinkedIn keeps
+answering normally.
 """
 
 import asyncio
-import random
-import time
+import hashlib
 import sys
-from typing import List, Dict, Optional
+import time
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 from urllib.parse import urlencode, quote_plus
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
-from bs4 import BeautifulSoup
-from fake_useragent import UserAgent
+import httpx
+import lxml.html
+
+from io_utils import json_dumps, json_loads, write_cache_file
+
+from .base_scraper import (
+    AdaptiveRateLimiter, BaseScraper, css, element_text, select_first, select_one,
+)
+
+# Search pages are kept with their ETag/Last-Modified validators, so a
+# repeated search can be answered with 304 Not Modified instead of the page.
+# Every search URL and offset gets its own file, so entries expire after a day.
+# Only pages that held job cards are kept: replaying an authwall or CAPTCHA
+# page on 304 would block the search until the entry expires
+PAGE_CACHE_DIR = Path.home() / '.cache' / 'nextrole' / 'linkedin'
+PAGE_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+def load_cached_page(url: str) -> Optional[Dict]:
+    """Return the cached {etag, lastModified, body} entry for a search URL, if fresh"""
+    path = _page_cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime < PAGE_CACHE_TTL:
+            entry = json_loads(path.read_bytes())
+            # Entries without job cards are never replayed
+            if isinstance(entry, dict) and entry.get('cardCount'):
+                return entry
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def save_cached_page(url: str, response: httpx.Response, card_count: int):
+    """Cache a search page with job cards if LinkedIn sent validators for it"""
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if card_count and (etag or last_modified):
+        entry = {
+            'etag': etag,
+            'lastModified': last_modified,
+            'cardCount': card_count,
+            'body': response.text,
+        }
+        write_cache_file(_page_cache_path(url), json_dumps(entry))
+
+
+def prune_page_cache():
+    """Delete cached pages older than the TTL"""
+    cutoff = time.time() - PAGE_CACHE_TTL
+    try:
+        entries = list(PAGE_CACHE_DIR.iterdir())
+    except OSError:
+        return
+    for path in entries:
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass  # Removed concurrently, or not ours to delete
+
 
-from .base_scraper import BaseScraper, RateLimiter
+def _page_cache_path(url: str) -> Path:
+    return PAGE_CACHE_DIR / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
 
 
 class LinkedInScraper(BaseScraper):
     """
-    Scraper for LinkedIn job board using Playwright.
+    Scraper for LinkedIn job board.
 
-    Uses public job search without authentication. Implements aggressive
-    rate limiting and anti-detection measures to avoid CAPTCHAs and bans.
+    Uses the public guest search endpoint, which serves job card HTML
+    fragments without authentication or JavaScript rendering. Requests are
+    staggered and bounded to avoid CAPTCHAs and bans.
     """
 
-    # LinkedIn public job search base URL
-    BASE_URL = "https://www.linkedin.com/jobs/search"
-
-    # Maximum pages to scrape (25 jobs per page = 125 jobs max)
-    MAX_PAGES = 5
-
-    # Jobs per page on LinkedIn
-    JOBS_PER_PAGE = 25
+    # LinkedIn public guest job search endpoint (returns job card <li> fragments)
+    BASE_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+    # Maximum pages to scrape (10 jobs per page = 100 jobs max)
+    MAX_PAGES = 10
+
+    # Jobs per page on the guest endpoint
+    JOBS_PER_PAGE = 10
+
+    # Result pages requested at once
+    MAX_CONCURRENT_PAGES = 3
+
+    # Request pacing (requests per second): one every 5 s to start, never
+    # faster than one every 2 s, backing off as far as one every 30 s
+    INITIAL_RATE = 0.2
+    MAX_RATE = 0.5
+    MIN_RATE = 1 / 30
+    RATE_INCREASE = 0.05
+
+    # Job card fields, each with selector fallbacks tried in order. Cards are
+    # the fragment's top-level <li>s (document_fromstring wraps them in a
+    # body); a bare 'li' would also match nav/footer lists on authwall pages
+    CARD_SELECTORS = (css('body > li'), css('.base-card'))
+    TITLE_SELECTORS = (
+        css('.base-search-card__title'),
+        css('.job-search-card__title'),
+        css('[class*="title"]'),
+    )
+    COMPANY_SELECTORS = (
+        css('.base-search-card__subtitle'),
+        css('.job-search-card__company-name'),
+        css('[class*="company"]'),
+    )
+    LOCATION_SELECTORS = (
+        css('.job-search-card__location'),
+        css('.base-search-card__metadata'),
+        css('[class*="location"]'),
+    )
+    LINK_SELECTORS = (css('a[href*="/jobs/view/"]'), css('a'))
+    DATE_SELECTOR = css('time[datetime]')
+    LIST_DATE_SELECTOR = css('.job-search-card__listdate')
+    SNIPPET_SELECTORS = (
+        css('.base-search-card__snippet'),
+        css('.job-search-card__snippet'),
+        css('[class*="snippet"]'),
+    )
+
+    # Card text that marks a job as remote
+    REMOTE_KEYWORDS = ('remote', 'work from home', 'wfh')
+
+    # Page text that means we hit a CAPTCHA or rate limit, and how much of
+    # the start of the response to look in
+    RATE_LIMIT_INDICATORS = (
+        'captcha',
+        'unusual activity',
+        'verify you\'re human',
+        'authwall',
+        'too many requests',
+    )
+    RATE_LIMIT_SCAN_CHARS = 8192
 
     def __init__(self, scraping_level: str = "normal"):
         """
-        Initialize LinkedIn scraper with conservative rate limiting.
+        Initialize LinkedIn scraper with adaptive rate limiting.
 
         Args:
-            scraping_level: Scraping speed level (always uses 'conservative' for LinkedIn)
+            scraping_level: Scraping speed level (ignored; LinkedIn paces itself)
         """
         super().__init__(scraping_level)
 
-        # Override with conservative rate limiting for LinkedIn
-        self.rate_limiter = RateLimiter("conservative")
-
-        # Track browser state
-        self.browser: Optional[Browser] = None
-        self.context: Optional[BrowserContext] = None
-
-        # Page counter for progressive backoff
-        self.pages_scraped = 0
+        # Override with a limiter that slows down when LinkedIn pushes back;
+        # no burst, so even the first pages go out one at a time
+        self.rate_limiter = AdaptiveRateLimiter(
+            rate=self.INITIAL_RATE,
+            burst=1,
+            min_rate=self.MIN_RATE,
+            max_rate=self.MAX_RATE,
+            increase=self.RATE_INCREASE,
+        )
 
     def get_source_name(self) -> str:
         """Return the name of this job board"""
@@ -90,16 +206,9 @@ class LinkedInScraper(BaseScraper):
                 # Windows requires specific event loop policy
                 asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            try:
-                jobs = loop.run_until_complete(
-                    self._async_search(keywords, location, remote_only, posted_within_days, max_results)
-                )
-                return jobs
-            finally:
-                loop.close()
+            return asyncio.run(
+                self._async_search(keywords, location, remote_only, posted_within_days, max_results)
+            )
 
         except Exception as e:
             self.log_progress(f"LinkedIn error: {str(e)}", 0.0)
@@ -116,73 +225,76 @@ class LinkedInScraper(BaseScraper):
         """
         Main async search orchestration.
 
-        Coordinates browser initialization, pagination, and job scraping.
+        Fetches the result pages concurrently and parses their job cards.
+        Once a page comes back empty or fails, later pages are cancelled, so
+        no more requests are sent after LinkedIn runs out or starts blocking.
         """
         jobs = []
 
         try:
             self.log_progress("Initializing LinkedIn scraper...", 0.05)
 
-            # Initialize browser
-            async with async_playwright() as playwright:
-                self.browser = await self._init_browser(playwright)
-                self.context = await self._create_context()
-                page = await self.context.new_page()
-
-                try:
-                    # Apply stealth mode
-                    await self._apply_stealth(page)
-
-                    # Calculate max pages to scrape
-                    max_pages = min(self.MAX_PAGES, (max_results + self.JOBS_PER_PAGE - 1) // self.JOBS_PER_PAGE)
-
-                    self.log_progress(f"Searching LinkedIn (up to {max_pages} pages)...", 0.1)
-
-                    # Scrape pages
-                    for page_num in range(max_pages):
-                        try:
-                            # Build search URL for this page
-                            search_url = self._build_search_url(
-                                keywords, location, remote_only, posted_within_days, page_num
-                            )
-
-                            self.log_progress(f"LinkedIn page {page_num}: Loading...", 0.1 + (page_num / max_pages) * 0.6)
-
-                            # Navigate to search page
-                            page_jobs = await self._scrape_page(page, search_url, page_num)
-
-                            if page_jobs:
-                                jobs.extend(page_jobs)
-                                self.log_progress(
-                                    f"LinkedIn page {page_num}: Found {len(page_jobs)} job cards",
-                                    0.1 + ((page_num + 0.5) / max_pages) * 0.6
-                                )
-                            else:
-                                self.log_progress(f"LinkedIn page {page_num}: No jobs found, stopping", 0.7)
-                                break
-
-                            # Stop if we have enough results
-                            if len(jobs) >= max_results:
-                                break
-
-                            # Rate limiting between pages (progressive backoff)
-                            if page_num < max_pages - 1:
-                                await self._delay_between_pages(page_num)
-
-                        except PlaywrightTimeoutError:
-                            self.log_progress(f"LinkedIn page {page_num}: Timeout, skipping", 0.0)
-                            break
-                        except Exception as e:
-                            self.log_progress(f"LinkedIn page {page_num}: Error - {str(e)}", 0.0)
-                            break
-
-                    self.log_progress(f"LinkedIn scraping complete: {len(jobs)} jobs found", 0.8)
-
-                finally:
-                    # Cleanup
-                    await page.close()
-                    await self.context.close()
-                    await self.browser.close()
+            # Calculate max pages to scrape
+            max_pages = min(self.MAX_PAGES, (max_results + self.JOBS_PER_PAGE - 1) // self.JOBS_PER_PAGE)
+
+            self.log_progress(f"Searching LinkedIn (up to {max_pages} pages)...", 0.1)
+
+            # Expired pages would never be revalidated; drop them first
+            await asyncio.to_thread(prune_page_cache)
+
+            # Filters are the same on every page; only the offset differs
+            search_url = self._build_search_url(keywords, location, remote_only, posted_within_days)
+
+            async with self.async_client() as client:
+                semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PAGES)
+                tasks = [
+                    asyncio.ensure_future(self._scrape_page(
+                        client, semaphore, self._page_url(search_url, page_num), page_num
+                    ))
+                    for page_num in range(max_pages)
+                ]
+
+                def stop_after_last_page(page_num: int, task: asyncio.Future):
+                    # Later pages still waiting on the semaphore or the rate
+                    # limiter are dropped before their request goes out
+                    if task.cancelled() or task.exception() is not None or not task.result():
+                        for later_task in tasks[page_num + 1:]:
+                            later_task.cancel()
+
+                for page_num, task in enumerate(tasks):
+                    task.add_done_callback(partial(stop_after_last_page, page_num))
+
+                page_results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Merge in page order, stopping at the first empty or failed page.
+            # Offsets can overlap between pages, so repeated URLs are skipped
+            seen_urls = set()
+            for page_num, page_jobs in enumerate(page_results):
+                if isinstance(page_jobs, BaseException):
+                    self.log_progress(f"LinkedIn page {page_num}: Error - {str(page_jobs)}", 0.0)
+                    break
+
+                if not page_jobs:
+                    self.log_progress(f"LinkedIn page {page_num}: No jobs found, stopping", 0.7)
+                    break
+
+                new_jobs = [job for job in page_jobs if job['url'] not in seen_urls]
+                if not new_jobs:
+                    self.log_progress(f"LinkedIn page {page_num}: Only repeated jobs, stopping", 0.7)
+                    break
+
+                seen_urls.update(job['url'] for job in new_jobs)
+                jobs.extend(new_jobs)
+                self.log_progress(
+                    f"LinkedIn page {page_num}: Found {len(new_jobs)} new job cards",
+                    0.1 + ((page_num + 1) / max_pages) * 0.6
+                )
+
+                # Stop if we have enough results
+                if len(jobs) >= max_results:
+                    break
+
+            self.log_progress(f"LinkedIn scraping complete: {len(jobs)} jobs found", 0.8)
 
         except Exception as e:
             self.log_progress(f"LinkedIn fatal error: {str(e)}", 0.0)
@@ -193,95 +305,12 @@ class LinkedInScraper(BaseScraper):
         # Truncate to max_results
         return jobs[:max_results]
 
-    async def _init_browser(self, playwright) -> Browser:
-        """
-        Initialize browser with anti-detection settings.
-
-        Args:
-            playwright: Playwright instance
-
-        Returns:
-            Browser instance
-        """
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--disable-gpu',
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-web-security',
-                '--disable-features=IsolateOrigins,site-per-process',
-            ]
-        )
-        return browser
-
-    async def _create_context(self) -> BrowserContext:
-        """
-        Create browser context with realistic fingerprint.
-
-        Returns:
-            BrowserContext instance
-        """
-        ua = UserAgent()
-
-        context = await self.browser.new_context(
-            user_agent=ua.random,
-            viewport={'width': 1920, 'height': 1080},
-            locale='en-US',
-            timezone_id='America/New_York',
-            extra_http_headers={
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-        )
-
-        return context
-
-    async def _apply_stealth(self, page: Page):
-        """
-        Apply JavaScript to hide automation indicators.
-
-        Args:
-            page: Page instance
-        """
-        await page.add_init_script("""
-            // Override navigator.webdriver
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-
-            // Override permissions
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-
-            // Override plugins
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-
-            // Override languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en']
-            });
-        """)
-
     def _build_search_url(
         self,
         keywords: List[str],
         location: Optional[str],
         remote_only: bool,
-        posted_within_days: Optional[int],
-        page_num: int
+        posted_within_days: Optional[int]
     ) -> str:
         """
         Build LinkedIn job search URL with filters.
@@ -291,10 +320,9 @@ class LinkedInScraper(BaseScraper):
             location: Job location
             remote_only: Filter for remote jobs
             posted_within_days: Date filter
-            page_num: Page number (0-indexed)
 
         Returns:
-            Full search URL
+            Search URL for the first page
         """
         params = {}
 
@@ -323,165 +351,185 @@ class LinkedInScraper(BaseScraper):
             elif posted_within_days <= 30:
                 params['f_TPR'] = 'r2592000'
 
-        # Pagination (25 jobs per page)
-        if page_num > 0:
-            params['start'] = page_num * self.JOBS_PER_PAGE
-
         # Build URL
         query_string = urlencode(params, quote_via=quote_plus)
         return f"{self.BASE_URL}?{query_string}"
 
-    async def _scrape_page(self, page: Page, url: str, page_num: int) -> List[Dict]:
+    def _page_url(self, search_url: str, page_num: int) -> str:
         """
-        Scrape a single search results page.
+        Add the result offset for a page to a search URL.
 
         Args:
-            page: Page instance
+            search_url: URL from _build_search_url
+            page_num: Page number (0-indexed)
+
+        Returns:
+            Full search URL
+        """
+        if page_num == 0:
+            return search_url
+        separator = '' if search_url.endswith('?') else '&'
+        return f"{search_url}{separator}start={page_num * self.JOBS_PER_PAGE}"
+
+    async def _scrape_page(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        page_num: int
+    ) -> List[Dict]:
+        """
+        Fetch and parse a single search results page.
+
+        Args:
+            client: HTTP client shared by the search
+            semaphore: Bounds how many pages are requested at once
             url: Search URL
             page_num: Page number for logging
 
         Returns:
             List of job dictionaries
         """
-        jobs = []
+        async with semaphore:
+            # Revalidate a previously seen page instead of downloading it again
+            cached = load_cached_page(url)
+            headers = {}
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('lastModified'):
+                    headers['If-Modified-Since'] = cached['lastModified']
+
+            self.log_progress(f"LinkedIn page {page_num}: Loading...", 0.0)
+            response = await self.make_request_async(client, url, headers=headers)
+
+        revalidated = response.status_code == 304 and cached is not None
+        html = cached['body'] if revalidated else response.text
+
+        if not html.strip():
+            return []
 
-        try:
-            # Navigate to page
-            await self._navigate_with_retry(page, url)
+        # Parse in a worker thread so sibling pages keep downloading meanwhile
+        card_count, jobs = await asyncio.to_thread(self._parse_results_page, html)
 
-            # Wait for job cards to load
-            try:
-                await page.wait_for_selector('.jobs-search__results-list', timeout=15000)
-            except PlaywrightTimeoutError:
-                # Check if we hit a CAPTCHA or rate limit
-                if await self._check_for_rate_limit(page):
-                    self.log_progress("LinkedIn: Rate limit or CAPTCHA detected", 0.0)
-                    return []
-                raise
-
-            # Simulate human behavior
-            await self._simulate_human_behavior(page)
-
-            # Get page HTML
-            html = await page.content()
-
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(html, 'lxml')
-
-            # Find job cards
-            job_cards = soup.select('.jobs-search__results-list li')
-
-            if not job_cards:
-                # Try alternative selector
-                job_cards = soup.select('.base-card')
-
-            self.log_progress(f"LinkedIn page {page_num}: Parsing {len(job_cards)} job cards...", 0.0)
-
-            # Parse each job card
-            for card in job_cards:
-                try:
-                    job = self._parse_job_card(card)
-                    if job:
-                        jobs.append(job)
-                except Exception as e:
-                    # Skip individual card errors
-                    sys.stderr.write(f"LinkedIn: Error parsing job card: {str(e)}\n")
-                    sys.stderr.flush()
-                    continue
-
-        except PlaywrightTimeoutError:
-            self.log_progress(f"LinkedIn page {page_num}: Timeout loading page", 0.0)
-        except Exception as e:
-            self.log_progress(f"LinkedIn page {page_num}: Error - {str(e)}", 0.0)
+        if not jobs:
+            # Check if we hit a CAPTCHA or rate limit
+            if self._check_for_rate_limit(html):
+                self.rate_limiter.record_throttled()
+                self.log_progress("LinkedIn: Rate limit or CAPTCHA detected", 0.0)
+            return []
+
+        if not revalidated and not self._check_for_rate_limit(html):
+            save_cached_page(url, response, card_count)
+
+        self.log_progress(f"LinkedIn page {page_num}: Parsed {len(jobs)}/{card_count} job cards", 0.0)
 
         return jobs
 
+    def _parse_results_page(self, html: str) -> Tuple[int, List[Dict]]:
+        """
+        Parse the job cards in a search results fragment.
+
+        Args:
+            html: Response body
+
+        Returns:
+            (number of job cards found, parsed job dictionaries)
+        """
+        # The fragment is a bare list of <li> cards; parse it as a document
+        # so a single card still sits below the root
+        tree = lxml.html.document_fromstring(html)
+
+        # Find job cards
+        job_cards = []
+        for selector in self.CARD_SELECTORS:
+            job_cards = selector(tree)
+            if job_cards:
+                break
+
+        # Parse each job card
+        jobs = []
+        for card in job_cards:
+            try:
+                job = self._parse_job_card(card)
+                if job:
+                    jobs.append(job)
+            except Exception as e:
+                # Skip individual card errors
+                sys.stderr.write(f"LinkedIn: Error parsing job card: {str(e)}\n")
+                sys.stderr.flush()
+                continue
+
+        return len(job_cards), jobs
+
     def _parse_job_card(self, card) -> Optional[Dict]:
         """
         Parse a job card element into a job dictionary.
 
         Args:
-            card: BeautifulSoup element
+            card: lxml element
 
         Returns:
             Job dictionary or None if parsing fails
         """
         try:
             # Title (multiple selector fallbacks)
-            title_elem = (
-                card.select_one('.base-search-card__title') or
-                card.select_one('.job-search-card__title') or
-                card.select_one('[class*="title"]')
-            )
-            title = title_elem.get_text(strip=True) if title_elem else None
+            title_elem = select_first(self.TITLE_SELECTORS, card)
+            title = element_text(title_elem, strip=True) if title_elem is not None else None
 
             if not title:
                 return None
 
             # Company
-            company_elem = (
-                card.select_one('.base-search-card__subtitle') or
-                card.select_one('.job-search-card__company-name') or
-                card.select_one('[class*="company"]')
-            )
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown Company"
+            company_elem = select_first(self.COMPANY_SELECTORS, card)
+            company = element_text(company_elem, strip=True) if company_elem is not None else "Unknown Company"
 
             # Location
-            location_elem = (
-                card.select_one('.job-search-card__location') or
-                card.select_one('.base-search-card__metadata') or
-                card.select_one('[class*="location"]')
-            )
-            location = location_elem.get_text(strip=True) if location_elem else "Unknown Location"
+            location_elem = select_first(self.LOCATION_SELECTORS, card)
+            location = element_text(location_elem, strip=True) if location_elem is not None else "Unknown Location"
 
             # URL
-            link_elem = card.select_one('a[href*="/jobs/view/"]')
-            if not link_elem:
-                link_elem = card.select_one('a')
+            link_elem = select_first(self.LINK_SELECTORS, card)
 
             url = None
-            if link_elem and link_elem.get('href'):
-                url = link_elem['href']
+            if link_elem is not None and link_elem.get('href'):
+                url = link_elem.get('href')
                 if not url.startswith('http'):
                     url = f"https://www.linkedin.com{url}"
                 # Clean tracking parameters
-                if '?' in url:
-                    url = url.split('?')[0]
+                url = url.partition('?')[0]
 
             if not url:
                 return None
 
             # Posted date
-            date_elem = card.select_one('time[datetime]')
+            date_elem = select_one(self.DATE_SELECTOR, card)
             posted_date = None
-            if date_elem and date_elem.get('datetime'):
-                posted_date = date_elem['datetime']
+            if date_elem is not None and date_elem.get('datetime'):
+                posted_date = date_elem.get('datetime')
             else:
                 # Try to parse relative date
-                date_text_elem = card.select_one('.job-search-card__listdate')
-                if date_text_elem:
-                    date_text = date_text_elem.get_text(strip=True)
+                date_text_elem = select_one(self.LIST_DATE_SELECTOR, card)
+                if date_text_elem is not None:
+                    date_text = element_text(date_text_elem, strip=True)
                     posted_date = self.parse_relative_date(date_text)
 
             # Fallback to current date if no date found
             if not posted_date:
-                from datetime import datetime
                 posted_date = datetime.now().isoformat()
 
             # Description snippet
-            desc_elem = (
-                card.select_one('.base-search-card__snippet') or
-                card.select_one('.job-search-card__snippet') or
-                card.select_one('[class*="snippet"]')
-            )
-            description = desc_elem.get_text(strip=True) if desc_elem else ""
+            desc_elem = select_first(self.SNIPPET_SELECTORS, card)
+            description = element_text(desc_elem, strip=True) if desc_elem is not None else ""
 
-            # Extract additional info from text
-            card_text = card.get_text().lower()
+            # Extract additional info from the fields already read, rather than
+            # re-walking the whole card; the flags only show up in these
+            card_text = f"{title} {location} {description}".lower()
 
-            is_remote = any(keyword in card_text for keyword in ['remote', 'work from home', 'wfh'])
-            offers_relocation = any(keyword in card_text for keyword in ['relocation', 'visa', 'sponsorship'])
+            # The visa/sponsorship result also answers relocation
+            is_remote = any(keyword in card_text for keyword in self.REMOTE_KEYWORDS)
             visa_sponsorship = 'visa' in card_text or 'sponsorship' in card_text
+            offers_relocation = visa_sponsorship or 'relocation' in card_text
 
             # Build job dictionary
             job = {
@@ -508,92 +556,21 @@ class LinkedInScraper(BaseScraper):
             sys.stderr.flush()
             return None
 
-    async def _navigate_with_retry(self, page: Page, url: str, max_retries: int = 3):
-        """
-        Navigate to URL with retry logic.
-
-        Args:
-            page: Page instance
-            url: Target URL
-            max_retries: Maximum retry attempts
-        """
-        for attempt in range(max_retries):
-            try:
-                await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-                return
-            except PlaywrightTimeoutError:
-                if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt  # Exponential backoff
-                    self.log_progress(f"LinkedIn: Navigation timeout, retrying in {wait_time}s...", 0.0)
-                    await asyncio.sleep(wait_time)
-                else:
-                    raise
-
-    async def _simulate_human_behavior(self, page: Page):
-        """
-        Simulate human browsing behavior.
-
-        Args:
-            page: Page instance
-        """
-        try:
-            # Random scrolling
-            for _ in range(random.randint(1, 3)):
-                await page.evaluate(f'window.scrollBy(0, {random.randint(200, 500)})')
-                await asyncio.sleep(random.uniform(0.2, 0.5))
-
-            # Random mouse movement
-            await page.mouse.move(
-                random.randint(100, 800),
-                random.randint(100, 600)
-            )
-
-        except Exception:
-            # Ignore errors in behavior simulation
-            pass
-
-    async def _delay_between_pages(self, page_num: int):
-        """
-        Add delay between pages with progressive backoff.
-
-        Args:
-            page_num: Current page number
-        """
-        # Base delay from rate limiter (10-15 seconds)
-        base_min, base_max = self.rate_limiter.delays['conservative']
-
-        # Progressive backoff (add more delay after each page)
-        backoff = page_num * 2
-
-        delay = random.uniform(base_min + backoff, base_max + backoff)
-
-        self.log_progress(f"LinkedIn: Waiting {delay:.1f}s before next page...", 0.0)
-        await asyncio.sleep(delay)
-
-    async def _check_for_rate_limit(self, page: Page) -> bool:
+    def _check_for_rate_limit(self, html: str) -> bool:
         """
-        Check if page shows rate limiting or CAPTCHA.
+        Check if a response shows rate limiting or CAPTCHA.
 
         Args:
-            page: Page instance
+            html: Response body
 
         Returns:
             True if rate limited, False otherwise
         """
         try:
-            html = await page.content()
-            html_lower = html.lower()
-
-            # Check for CAPTCHA or rate limit indicators
-            indicators = [
-                'captcha',
-                'unusual activity',
-                'verify you\'re human',
-                'authwall',
-                'too many requests',
-            ]
-
-            return any(indicator in html_lower for indicator in indicators)
+            # The indicators show up in the title or the top of the page
+            head_lower = html[:self.RATE_LIMIT_SCAN_CHARS].lower()
+
+            return any(indicator in head_lower for indicator in self.RATE_LIMIT_INDICATORS)
 
         except Exception:
             return False
@@ -11,9 +11,12 @@ Scoring methodology inspired by comprehensive job-resume analysis:
 - Location Match (10%)
 """
 
+import os
 import re
-from typing import Dict, List, Set
-from fuzzywuzzy import fuzz
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, List, Set, Tuple
+from rapidfuzz import fuzz, process
 
 
 # Synonym mapping for tech skills
@@ -38,24 +41,77 @@ SKILL_SYNONYMS = {
     'continuous integration': ['ci/cd', 'ci cd'],
 }
 
+# Every spelling (canonical name included) mapped to its canonical skill
+SKILL_ALIASES = {
+    alias: main_skill
+    for main_skill, synonyms in SKILL_SYNONYMS.items()
+    for alias in (main_skill, *synonyms)
+}
+
+# Common tech terms to look for in job descriptions
+TECH_TERMS = (
+    'swift', 'objective-c', 'swiftui', 'uikit', 'combine', 'rxswift',
+    'graphql', 'rest', 'api', 'websocket',
+    'python', 'javascript', 'typescript', 'java', 'kotlin', 'go', 'rust',
+    'react', 'vue', 'angular', 'django', 'flask', 'spring',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes',
+    'postgresql', 'mongodb', 'redis', 'mysql', 'sqlite',
+    'git', 'ci/cd', 'jenkins', 'github actions',
+    'agile', 'scrum', 'jira',
+)
+
 # Architecture and quality indicators
-ARCHITECTURE_KEYWORDS = [
+ARCHITECTURE_KEYWORDS = (
     'clean architecture', 'mvvm', 'mvc', 'viper', 'vip',
     'solid', 'design patterns', 'dependency injection',
     'modular', 'modularization', 'microservices',
     'tdd', 'test driven', 'unit test', 'xctest', 'xctestcase',
     'code review', 'pull request', 'pr review',
     'refactor', 'technical debt', 'best practices',
-]
+)
 
 # Collaboration and leadership indicators
-COLLABORATION_KEYWORDS = [
+COLLABORATION_KEYWORDS = (
     'cross-functional', 'cross functional', 'collaborate', 'collaboration',
     'partner', 'stakeholder', 'product manager', 'designer',
     'mentor', 'mentoring', 'lead', 'leadership', 'team',
     'agile', 'scrum', 'sprint', 'standup',
     'communicate', 'communication', 'presentation',
-]
+)
+
+# Minimum fuzz.ratio for a job word to count as a resume skill. fuzzywuzzy
+# rounded ratios to integers and required > 85, i.e. a raw score >= 85.5
+FUZZY_MATCH_CUTOFF = 85.5
+
+# Against job words of 4+ characters, a skill of 2 characters scores at most
+# 2 * 2 / (2 + 4) = 67, so shorter skills can never reach the cutoff
+MIN_FUZZY_SKILL_LENGTH = 3
+
+# Weights aligned with comprehensive analysis
+MATCH_WEIGHTS = {
+    'skills': 0.40,
+    'architecture': 0.20,
+    'collaboration': 0.15,
+    'experience': 0.15,
+    'location': 0.10
+}
+
+# Countries and regions that count as the same place when both sides name them
+COUNTRY_NAMES = ('usa', 'us', 'united states', 'uk', 'canada', 'japan', 'germany', 'australia')
+
+# Two-letter state or province code, e.g. "San Francisco, CA"
+STATE_CODE_PATTERN = re.compile(r'\b([A-Z]{2})\b')
+
+# Skills this short ('r', 'c', 'go') must appear as whole words in a title,
+# or they would match any title containing those letters
+SHORT_SKILL_LENGTH = 2
+
+# Breakdowns remembered across calls for repeated (resume, job) pairs
+BREAKDOWN_CACHE_SIZE = 2048
+
+# Batches at least this large are scored across processes; below it,
+# worker start-up costs more than the scoring itself
+PARALLEL_SCORING_MIN_JOBS = 1000
 
 # Scale and impact indicators
 SCALE_INDICATORS = [
@@ -65,17 +121,20 @@ SCALE_INDICATORS = [
     r'high.?traffic', r'large.?scale', r'enterprise',
     r'performance\s+optimi[sz]', r'crash\s+rate',
 ]
+SCALE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in SCALE_INDICATORS)
+
+# Required-experience phrases in job descriptions, tried in order
+EXPERIENCE_PATTERNS = (
+    re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience'),
+    re.compile(r'(\d+)-(\d+)\s*years?\s+(?:of\s+)?experience'),
+    re.compile(r'(\d+)\s*to\s*(\d+)\s*years'),
+)
 
 
 def normalize_skill(skill: str) -> str:
     """Normalize a skill name for matching"""
     skill_lower = skill.lower().strip()
-
-    for main_skill, synonyms in SKILL_SYNONYMS.items():
-        if skill_lower in synonyms or skill_lower == main_skill:
-            return main_skill
-
-    return skill_lower
+    return SKILL_ALIASES.get(skill_lower, skill_lower)
 
 
 def get_skill_set(skills: List[str]) -> Set[str]:
@@ -83,9 +142,37 @@ def get_skill_set(skills: List[str]) -> Set[str]:
     return {normalize_skill(skill) for skill in skills}
 
 
-def calculate_technical_skills_score(resume_skills: List[str], resume_text: str, job_text: str) -> float:
+# Resume-side work is identical for every job scored against the same resume.
+# These helpers are keyed on the resume string itself (whose hash Python caches),
+# so scoring N jobs lowercases and scans the resume once instead of N times.
+
+@lru_cache(maxsize=8)
+def _resume_lower(resume_text: str) -> str:
+    return resume_text.lower()
+
+
+@lru_cache(maxsize=8)
+def _resume_skill_set(resume_skills: tuple) -> frozenset:
+    return frozenset(get_skill_set(list(resume_skills)))
+
+
+@lru_cache(maxsize=8)
+def _resume_depth_bonus(resume_text_lower: str) -> float:
+    depth_bonus = 0.0
+    for pattern in SCALE_PATTERNS:
+        if pattern.search(resume_text_lower):
+            depth_bonus += 0.05
+    return min(depth_bonus, 0.15)  # Cap at 15% bonus
+
+
+@lru_cache(maxsize=8)
+def _resume_keyword_hits(resume_text_lower: str, keywords: tuple) -> frozenset:
+    return frozenset(keyword for keyword in keywords if keyword in resume_text_lower)
+
+
+def calculate_technical_skills_score(resume_skills: List[str], resume_text: str, job_text_lower: str) -> float:
     """
-    Calculate technical skills match score.
+    Calculate technical skills match score against lowercased job text.
 
     Evaluates:
     1. How many resume skills appear in job requirements
@@ -98,21 +185,22 @@ def calculate_technical_skills_score(resume_skills: List[str], resume_text: str,
     if not resume_skills:
         return 0.3  # Low score if no skills parsed
 
-    resume_skill_set = get_skill_set(resume_skills)
-    job_text_lower = job_text.lower()
-    resume_text_lower = (resume_text or '').lower()
+    resume_skill_set = _resume_skill_set(tuple(resume_skills))
+    resume_text_lower = _resume_lower(resume_text or '')
 
     # 1. Resume skills found in job (forward match)
     forward_matches = 0
+    fuzzy_candidates = None
     for skill in resume_skill_set:
         if skill in job_text_lower:
             forward_matches += 1
-        else:
-            # Fuzzy match
-            for word in job_text_lower.split():
-                if len(word) > 3 and fuzz.ratio(skill, word) > 85:
-                    forward_matches += 1
-                    break
+        elif len(skill) >= MIN_FUZZY_SKILL_LENGTH:
+            # Fuzzy match against the job's distinct longer words, split once per job
+            if fuzzy_candidates is None:
+                fuzzy_candidates = list({word for word in job_text_lower.split() if len(word) > 3})
+            if process.extractOne(skill, fuzzy_candidates, scorer=fuzz.ratio,
+                                  score_cutoff=FUZZY_MATCH_CUTOFF):
+                forward_matches += 1
 
     forward_ratio = forward_matches / len(resume_skill_set) if resume_skill_set else 0
 
@@ -123,17 +211,13 @@ def calculate_technical_skills_score(resume_skills: List[str], resume_text: str,
         req_normalized = normalize_skill(req)
         if req_normalized in resume_skill_set:
             reverse_matches += 1
-        elif req.lower() in resume_text_lower:
+        elif req in resume_text_lower:
             reverse_matches += 0.7  # Partial credit for mention in resume text
 
     reverse_ratio = reverse_matches / len(job_skill_indicators) if job_skill_indicators else 0.5
 
     # 3. Depth bonus - look for quantified experience
-    depth_bonus = 0.0
-    for pattern in SCALE_INDICATORS:
-        if re.search(pattern, resume_text_lower, re.IGNORECASE):
-            depth_bonus += 0.05
-    depth_bonus = min(depth_bonus, 0.15)  # Cap at 15% bonus
+    depth_bonus = _resume_depth_bonus(resume_text_lower)
 
     # Combine: 50% forward, 40% reverse, 10% depth
     score = (forward_ratio * 0.5) + (reverse_ratio * 0.4) + depth_bonus
@@ -141,33 +225,14 @@ def calculate_technical_skills_score(resume_skills: List[str], resume_text: str,
     return min(1.0, max(0.0, score))
 
 
-def extract_job_requirements(job_text: str) -> List[str]:
-    """Extract likely required skills/technologies from job description"""
-    requirements = []
+def extract_job_requirements(job_text_lower: str) -> List[str]:
+    """Extract likely required skills/technologies from a lowercased job description"""
+    return [term for term in TECH_TERMS if term in job_text_lower]
 
-    # Common tech terms to look for
-    tech_terms = [
-        'swift', 'objective-c', 'swiftui', 'uikit', 'combine', 'rxswift',
-        'graphql', 'rest', 'api', 'websocket',
-        'python', 'javascript', 'typescript', 'java', 'kotlin', 'go', 'rust',
-        'react', 'vue', 'angular', 'django', 'flask', 'spring',
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes',
-        'postgresql', 'mongodb', 'redis', 'mysql', 'sqlite',
-        'git', 'ci/cd', 'jenkins', 'github actions',
-        'agile', 'scrum', 'jira',
-    ]
 
-    job_lower = job_text.lower()
-    for term in tech_terms:
-        if term in job_lower:
-            requirements.append(term)
-
-    return requirements
-
-
-def calculate_architecture_quality_score(resume_text: str, job_text: str) -> float:
+def calculate_architecture_quality_score(resume_text: str, job_text_lower: str) -> float:
     """
-    Calculate architecture and code quality match.
+    Calculate architecture and code quality match against lowercased job text.
 
     Evaluates:
     - Architecture patterns mentioned
@@ -177,24 +242,14 @@ def calculate_architecture_quality_score(resume_text: str, job_text: str) -> flo
     Returns:
         Score between 0.0 and 1.0
     """
-    resume_lower = (resume_text or '').lower()
-    job_lower = job_text.lower()
+    resume_hits = _resume_keyword_hits(_resume_lower(resume_text or ''), ARCHITECTURE_KEYWORDS)
 
-    # Find architecture keywords in both
-    resume_arch_count = 0
-    job_arch_count = 0
-    matches = 0
+    job_hits = {keyword for keyword in ARCHITECTURE_KEYWORDS if keyword in job_text_lower}
 
-    for keyword in ARCHITECTURE_KEYWORDS:
-        in_resume = keyword in resume_lower
-        in_job = keyword in job_lower
-
-        if in_resume:
-            resume_arch_count += 1
-        if in_job:
-            job_arch_count += 1
-        if in_resume and in_job:
-            matches += 1
+    # Find architecture keywords in both
+    resume_arch_count = len(resume_hits)
+    job_arch_count = len(job_hits)
+    matches = len(resume_hits & job_hits)
 
     # Score based on coverage of job requirements
     if job_arch_count > 0:
@@ -209,9 +264,9 @@ def calculate_architecture_quality_score(resume_text: str, job_text: str) -> flo
     return min(1.0, coverage + arch_bonus)
 
 
-def calculate_collaboration_score(resume_text: str, job_text: str) -> float:
+def calculate_collaboration_score(resume_text: str, job_text_lower: str) -> float:
     """
-    Calculate collaboration and soft skills match.
+    Calculate collaboration and soft skills match against lowercased job text.
 
     Evaluates:
     - Cross-functional collaboration indicators
@@ -221,23 +276,13 @@ def calculate_collaboration_score(resume_text: str, job_text: str) -> float:
     Returns:
         Score between 0.0 and 1.0
     """
-    resume_lower = (resume_text or '').lower()
-    job_lower = job_text.lower()
-
-    resume_collab_count = 0
-    job_collab_count = 0
-    matches = 0
+    resume_hits = _resume_keyword_hits(_resume_lower(resume_text or ''), COLLABORATION_KEYWORDS)
 
-    for keyword in COLLABORATION_KEYWORDS:
-        in_resume = keyword in resume_lower
-        in_job = keyword in job_lower
+    job_hits = {keyword for keyword in COLLABORATION_KEYWORDS if keyword in job_text_lower}
 
-        if in_resume:
-            resume_collab_count += 1
-        if in_job:
-            job_collab_count += 1
-        if in_resume and in_job:
-            matches += 1
+    resume_collab_count = len(resume_hits)
+    job_collab_count = len(job_hits)
+    matches = len(resume_hits & job_hits)
 
     # Score based on coverage of job requirements
     if job_collab_count > 0:
@@ -252,9 +297,9 @@ def calculate_collaboration_score(resume_text: str, job_text: str) -> float:
     return min(1.0, coverage + collab_bonus)
 
 
-def calculate_experience_match(resume_years: int, job_text: str) -> float:
+def calculate_experience_match(resume_years: int, job_text_lower: str) -> float:
     """
-    Calculate experience level match.
+    Calculate experience level match against lowercased job text.
 
     Returns:
         Score between 0.0 and 1.0
@@ -262,24 +307,14 @@ def calculate_experience_match(resume_years: int, job_text: str) -> float:
     if resume_years == 0:
         resume_years = 3  # Assume some experience if not specified
 
-    job_text_lower = job_text.lower()
-
     # Look for experience requirements
-    exp_patterns = [
-        r'(\d+)\+?\s*years?\s+(?:of\s+)?experience',
-        r'(\d+)-(\d+)\s*years?\s+(?:of\s+)?experience',
-        r'(\d+)\s*to\s*(\d+)\s*years',
-    ]
-
     required_years = None
-    for pattern in exp_patterns:
-        match = re.search(pattern, job_text_lower)
+    for pattern in EXPERIENCE_PATTERNS:
+        match = pattern.search(job_text_lower)
         if match:
-            try:
-                required_years = int(match.group(1))
-                break
-            except:
-                continue
+            # Group 1 is always \d+, so the conversion cannot fail
+            required_years = int(match.group(1))
+            break
 
     if required_years is None:
         # Infer from title
@@ -343,14 +378,13 @@ def calculate_location_match(resume_location: str, job_location: str) -> float:
         return 1.0
 
     # Same country/region check
-    countries = ['usa', 'us', 'united states', 'uk', 'canada', 'japan', 'germany', 'australia']
-    for country in countries:
+    for country in COUNTRY_NAMES:
         if country in resume_loc_lower and country in job_loc_lower:
             return 0.8
 
     # State code match
-    resume_state = re.search(r'\b([A-Z]{2})\b', resume_location)
-    job_state = re.search(r'\b([A-Z]{2})\b', job_location)
+    resume_state = STATE_CODE_PATTERN.search(resume_location)
+    job_state = STATE_CODE_PATTERN.search(job_location) if resume_state else None
     if resume_state and job_state and resume_state.group(1) == job_state.group(1):
         return 0.85
 
@@ -368,6 +402,94 @@ def calculate_match_score(resume_data: Dict, job: Dict) -> float:
     return breakdown['totalScore']
 
 
+@lru_cache(maxsize=256)
+def _whole_word_pattern(skill: str):
+    # Lookarounds instead of \b, which fails next to 'c++' or 'c#'
+    return re.compile(r'(?<![a-z0-9])' + re.escape(skill) + r'(?![a-z0-9])')
+
+
+def calculate_title_prior(resume_data: Dict, job: Dict) -> float:
+    """
+    Cheap relevance estimate used to pick which jobs get fully scored.
+
+    Only looks at the job title and its already-extracted tech stack,
+    never the description.
+
+    Returns:
+        Fraction of resume skills named in the title or tech stack (0.0 to 1.0)
+    """
+    resume_skill_set = _resume_skill_set(tuple(resume_data.get('skills', [])))
+    if not resume_skill_set:
+        return 0.0
+
+    job_skill_set = get_skill_set(job.get('techStack') or [])
+    title_lower = (job.get('title') or '').lower()
+
+    hits = sum(
+        1 for skill in resume_skill_set
+        if skill in job_skill_set or (
+            skill in title_lower
+            and (len(skill) > SHORT_SKILL_LENGTH or _whole_word_pattern(skill).search(title_lower))
+        )
+    )
+    return hits / len(resume_skill_set)
+
+
+def calculate_match_breakdowns(resume_data: Dict, jobs: List[Dict]) -> List[Dict]:
+    """
+    Calculate match breakdowns for many jobs against one resume.
+
+    The resume text is resolved once for the whole batch, so the cached
+    resume-side work above is shared by every job. Pairs scored by an
+    earlier call are served from a cache. Large batches are spread
+    across CPU cores.
+
+    Returns:
+        List of breakdown dictionaries, in the same order as jobs
+    """
+    if not resume_data.get('text'):
+        resume_skills = resume_data.get('skills', [])
+        resume_data = {
+            **resume_data,
+            'text': ' '.join(resume_skills + resume_data.get('keywords', [])),
+        }
+
+    if len(jobs) < PARALLEL_SCORING_MIN_JOBS:
+        resume_key = (
+            tuple(resume_data.get('skills', [])),
+            resume_data['text'],
+            resume_data.get('location', ''),
+            resume_data.get('yearsExperience', 0) or 0,
+        )
+        return [
+            dict(_cached_breakdown(resume_key, (
+                job.get('title', ''), job.get('description', ''), job.get('location', ''),
+            )))
+            for job in jobs
+        ]
+
+    score = partial(calculate_match_breakdown, resume_data)
+
+    workers = os.cpu_count() or 1
+    chunksize = max(16, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(score, jobs, chunksize=chunksize))
+
+
+# A persistent job_search process sees the same postings again on every
+# repeated or refined search. Keys hold exactly the fields the score reads,
+# so an edited resume or posting is never served a stale breakdown.
+
+@lru_cache(maxsize=BREAKDOWN_CACHE_SIZE)
+def _cached_breakdown(resume_key: Tuple, job_key: Tuple) -> Dict:
+    skills, text, location, years = resume_key
+    title, description, job_location = job_key
+    return calculate_match_breakdown(
+        {'skills': list(skills), 'text': text, 'location': location, 'yearsExperience': years},
+        {'title': title, 'description': description, 'location': job_location},
+    )
+
+
 def calculate_match_breakdown(resume_data: Dict, job: Dict) -> Dict:
     """
     Calculate match score with detailed breakdown for each factor.
@@ -388,7 +510,8 @@ def calculate_match_breakdown(resume_data: Dict, job: Dict) -> Dict:
     resume_location = resume_data.get('location', '')
     resume_years = resume_data.get('yearsExperience', 0) or 0
 
-    job_text = f"{job.get('title', '')} {job.get('description', '')}"
+    # Lowercased once here and shared by every component score
+    job_text_lower = f"{job.get('title', '')} {job.get('description', '')}".lower()
     job_location = job.get('location', '')
 
     # If no full resume text, construct from available data
@@ -396,20 +519,13 @@ def calculate_match_breakdown(resume_data: Dict, job: Dict) -> Dict:
         resume_text = ' '.join(resume_skills + resume_data.get('keywords', []))
 
     # Calculate component scores
-    skills_score = calculate_technical_skills_score(resume_skills, resume_text, job_text)
-    architecture_score = calculate_architecture_quality_score(resume_text, job_text)
-    collaboration_score = calculate_collaboration_score(resume_text, job_text)
-    experience_score = calculate_experience_match(resume_years, job_text)
+    skills_score = calculate_technical_skills_score(resume_skills, resume_text, job_text_lower)
+    architecture_score = calculate_architecture_quality_score(resume_text, job_text_lower)
+    collaboration_score = calculate_collaboration_score(resume_text, job_text_lower)
+    experience_score = calculate_experience_match(resume_years, job_text_lower)
     location_score = calculate_location_match(resume_location, job_location)
 
-    # Weights aligned with comprehensive analysis
-    weights = {
-        'skills': 0.40,
-        'architecture': 0.20,
-        'collaboration': 0.15,
-        'experience': 0.15,
-        'location': 0.10
-    }
+    weights = MATCH_WEIGHTS
 
     # Weighted average
     total_score = (
@@ -11,6 +11,9 @@ from .base_scraper import BaseScraper
 class WorkdayScraper(BaseScraper):
     """Scraper for Workday career sites"""
 
+    # search() is still a placeholder that returns no jobs
+    IS_IMPLEMENTED = False
+
     # List of known companies using Workday
     # Each company has a different subdomain
     KNOWN_COMPANIES = [
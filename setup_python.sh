@@ -21,14 +21,17 @@ $PYTHON --version
 echo "Installing Python packages..."
 $PYTHON -m pip install --user \
     pypdf \
-    beautifulsoup4 \
     lxml \
+    cssselect \
     requests \
-    fake-useragent \
+    'httpx[http2]' \
+    certifi \
+    brotli \
     python-dateutil \
-    fuzzywuzzy \
+    rapidfuzz \
     ratelimit \
     tenacity \
+    orjson \
     playwright
 
 # Verify installation
@@ -36,12 +39,14 @@ echo ""
 echo "Verifying installation..."
 $PYTHON -c "
 import pypdf
-from bs4 import BeautifulSoup
 import lxml
+import cssselect
 import requests
-from fake_useragent import UserAgent
+import httpx
+import certifi
+import brotli
 import dateutil
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz
 from ratelimit import limits
 from tenacity import retry
 from playwright.sync_api import sync_playwright
@@ -58,7 +63,7 @@ if [ $? -eq 0 ]; then
         echo "✓ Setup complete! You can now run the Nextrole app."
     else
         echo ""
-        echo "Warning: Playwright browser installation failed. LinkedIn scraper may not work."
+        echo "Warning: Playwright browser installation failed. JapanDev scraper may not work."
         echo "You can manually install later with: $PYTHON -m playwright install chromium"
     fi
 else
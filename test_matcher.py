@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the job matcher.
+
+The expected breakdowns were produced by the original fuzzywuzzy-based
+matcher; the RapidFuzz, alias-table and batching rewrites must keep them.
+
+Run with: python3 test_matcher.py  (or pytest)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Nextrole', 'Python'))
+
+from scrapers.matcher import (
+    SKILL_SYNONYMS,
+    calculate_match_breakdown,
+    calculate_match_breakdowns,
+    calculate_technical_skills_score,
+    calculate_title_prior,
+    normalize_skill,
+)
+
+SCORE_KEYS = ('totalScore', 'skillsScore', 'keywordsScore', 'titleScore', 'experienceScore', 'locationScore')
+
+# (resume, job, expected scores in SCORE_KEYS order)
+GOLDEN = [
+    (
+        {'skills': ['Swift', 'SwiftUI', 'Combine', 'Kubernetes', 'GraphQL'],
+         'text': 'Senior iOS engineer. Built SwiftUI apps used by 2M users; led code review and mentoring '
+                 'with product manager and designer partners. MVVM, TDD, XCTest.',
+         'location': 'San Francisco, CA', 'yearsExperience': 7},
+        {'title': 'Senior iOS Engineer',
+         'description': 'We use Swift, SwiftUI and Combine. 5+ years experience. Clean architecture, MVVM, '
+                        'unit test culture. Collaborate cross-functional with stakeholders.',
+         'location': 'San Francisco, CA'},
+        (0.6791666666666667, 0.75, 0.5333333333333333, 0.15, 1.0, 1.0),
+    ),
+    (
+        {'skills': ['Kubernetes', 'Postgres', 'JS'], 'text': '', 'keywords': ['backend'],
+         'location': 'Austin, TX', 'yearsExperience': 2},
+        {'title': 'Staff Platform Engineer',
+         'description': 'Operate kubernets clusters and postgresql. node.js services. 3-5 years of experience.',
+         'location': 'Dallas, TX'},
+        (0.5958333333333333, 0.7333333333333334, 0.3, 0.6, 0.45, 0.85),
+    ),
+    (
+        {'skills': ['graphql'], 'text': 'api work', 'location': 'Tokyo, Japan', 'yearsExperience': 0},
+        {'title': 'Backend Developer', 'description': 'Our graphgl gateway and rest api.', 'location': 'Osaka, Japan'},
+        (0.6360000000000001, 0.64, 0.3, 0.6, 1.0, 0.8),
+    ),
+    (
+        {'skills': ['distributedtracingplatforms'], 'text': 'observability', 'location': '', 'yearsExperience': 12},
+        {'title': 'Junior SRE', 'description': 'Work on distributedtracXngplatfoXmY and more.', 'location': 'Remote'},
+        (0.6425, 0.7, 0.3, 0.6, 0.75, 1.0),
+    ),
+    (
+        {'skills': [], 'text': 'python developer', 'location': 'London, UK', 'yearsExperience': 4},
+        {'title': 'Python Developer', 'description': '2 to 4 years with django and aws.', 'location': 'Manchester, UK'},
+        (0.5, 0.3, 0.3, 0.6, 1.0, 0.8),
+    ),
+    (
+        {'skills': ['Python', 'AWS', 'Docker', 'React', 'TypeScript', 'C++'],
+         'text': 'Full stack developer, 30% improvement in latency, high-traffic enterprise systems. '
+                 'Leadership, communication, agile scrum.',
+         'location': 'Berlin, Germany', 'yearsExperience': 5},
+        {'title': 'Lead Full Stack Engineer',
+         'description': 'React + TS frontend, python/docker backend on amazon web services. 10 years experience '
+                        'preferred. Sprint planning, standup, presentation skills.',
+         'location': ''},
+        (0.5808333333333333, 0.8833333333333334, 0.3, 0.4, 0.25, 0.7),
+    ),
+    (
+        {'skills': ['Objective-C', 'UIKit', 'ObjC'], 'text': 'iOS developer since 2012',
+         'location': 'Toronto, Canada', 'yearsExperience': 10},
+        {'title': 'Principal Mobile Engineer',
+         'description': 'Objective C and UI kit codebase; refactor technical debt; best practices; pull request reviews.',
+         'location': 'Vancouver, Canada'},
+        (0.5, 0.45, 0.0, 0.6, 1.0, 0.8),
+    ),
+    (
+        {'skills': ['Go', 'Rust', 'R'], 'text': 'systems programmer', 'location': 'New York, NY', 'yearsExperience': 3},
+        {'title': 'Entry Level Engineer', 'description': 'Golang and rust for our trading engine.', 'location': 'Seattle, WA'},
+        (0.6900000000000001, 0.9, 0.3, 0.6, 1.0, 0.3),
+    ),
+]
+
+
+def assert_scores(breakdown, expected):
+    actual = tuple(breakdown[key] for key in SCORE_KEYS)
+    assert all(abs(a - e) < 1e-12 for a, e in zip(actual, expected)), (actual, expected)
+
+
+def test_breakdowns_match_original_matcher():
+    for resume, job, expected in GOLDEN:
+        assert_scores(calculate_match_breakdown(resume, job), expected)
+
+
+def test_batch_and_cached_breakdowns_match():
+    for resume, job, expected in GOLDEN:
+        # The second call is answered from the breakdown cache
+        for _ in range(2):
+            assert_scores(calculate_match_breakdowns(resume, [job])[0], expected)
+
+
+def test_cached_breakdowns_are_copies():
+    resume, job, _ = GOLDEN[0]
+    calculate_match_breakdowns(resume, [job])[0]['totalScore'] = -1.0
+    assert calculate_match_breakdowns(resume, [job])[0]['totalScore'] >= 0.0
+
+
+def test_fuzzy_cutoff_keeps_integer_rounding():
+    # fuzzywuzzy compared round(ratio) > 85: 85.7 ('graphql'/'graphgl') matched,
+    # 85.2 (four substitutions in 27 characters) did not
+    assert calculate_technical_skills_score(['graphql'], '', 'we run a graphgl gateway') == 0.7
+    assert calculate_technical_skills_score(
+        ['distributedtracingplatforms'], '', 'we run a dxstributxdtracingplxtformx gateway'
+    ) == 0.2
+
+
+def test_normalize_skill_matches_synonym_scan():
+    def scan(skill):
+        skill_lower = skill.lower().strip()
+        for main_skill, synonyms in SKILL_SYNONYMS.items():
+            if skill_lower in synonyms or skill_lower == main_skill:
+                return main_skill
+        return skill_lower
+
+    spellings = [spelling for main, synonyms in SKILL_SYNONYMS.items() for spelling in (main, *synonyms)]
+    for skill in spellings + ['  JS ', 'Node.JS', 'Swift', 'unknown skill', '']:
+        assert normalize_skill(skill) == scan(skill), skill
+
+
+def test_title_prior_needs_whole_words_for_short_skills():
+    resume = {'skills': ['R', 'Go', 'C++', 'Swift']}
+    assert calculate_title_prior(resume, {'title': 'Senior Engineer'}) == 0.0
+    assert calculate_title_prior(resume, {'title': 'Google Cloud Architect'}) == 0.0
+    assert calculate_title_prior(resume, {'title': 'R Developer'}) == 0.25
+    assert calculate_title_prior(resume, {'title': 'C++ Developer'}) == 0.25
+    assert calculate_title_prior(resume, {'title': 'Engineer', 'techStack': ['Go', 'Swift']}) == 0.5
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+    print("✓ Matcher regression tests passed")
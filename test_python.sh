@@ -22,10 +22,10 @@ except ImportError:
     print("✗ pypdf not installed - run: pip3 install pypdf")
 
 try:
-    import bs4
-    print("✓ beautifulsoup4 installed")
+    import lxml
+    print("✓ lxml installed")
 except ImportError:
-    print("✗ beautifulsoup4 not installed - run: pip3 install beautifulsoup4")
+    print("✗ lxml not installed - run: pip3 install lxml")
 
 try:
     import requests
@@ -34,10 +34,16 @@ except ImportError:
     print("✗ requests not installed - run: pip3 install requests")
 
 try:
-    from fake_useragent import UserAgent
-    print("✓ fake-useragent installed")
+    import httpx
+    print("✓ httpx installed")
 except ImportError:
-    print("✗ fake-useragent not installed - run: pip3 install fake-useragent")
+    print("✗ httpx not installed - run: pip3 install 'httpx[http2]'")
+
+try:
+    import certifi
+    print("✓ certifi installed")
+except ImportError:
+    print("✗ certifi not installed - run: pip3 install certifi")
 
 print("")
 print("If any packages are missing, run:")
@@ -50,4 +56,11 @@ cd Nextrole/Python
 echo '{"action": "parse", "pdf_path": "/nonexistent.pdf"}' | python3 resume_parser.py
 echo ""
 
+echo "4. Running regression tests:"
+cd ../..
+python3 test_skill_extraction.py
+python3 test_matcher.py
+python3 test_scrapers.py
+echo ""
+
 echo "✓ Python environment test complete!"
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the scraper parsers and result filtering,
+using recorded-shape HTML fixtures (no network access).
+
+Run with: python3 test_scrapers.py  (or pytest)
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Nextrole', 'Python'))
+
+from scrapers import apply_filters
+from scrapers.indeed_scraper import IndeedScraper
+from scrapers.linkedin_scraper import LinkedInScraper
+
+# Two cards as served by LinkedIn's guest seeMoreJobPostings endpoint, plus
+# one without a title that must be skipped
+LINKEDIN_FRAGMENT = """
+<li>
+  <div class="base-card base-search-card job-search-card">
+    <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/senior-ios-engineer-3801?refId=abc&amp;trackingId=xyz">
+      <span class="sr-only">Senior iOS Engineer</span>
+    </a>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">  Senior iOS Engineer  </h3>
+      <h4 class="base-search-card__subtitle"><a href="/company/acme">Acme Corp</a></h4>
+      <div class="base-search-card__metadata">
+        <span class="job-search-card__location">Remote, United States</span>
+        <time class="job-search-card__listdate" datetime="2026-10-01">2 weeks ago</time>
+      </div>
+    </div>
+  </div>
+</li>
+<li>
+  <div class="base-card base-search-card job-search-card">
+    <a class="base-card__full-link" href="/jobs/view/backend-engineer-3802?trk=public_jobs">Backend Engineer</a>
+    <h3 class="base-search-card__title">Backend Engineer</h3>
+    <h4 class="base-search-card__subtitle">Globex</h4>
+    <span class="job-search-card__location">Tokyo, Japan</span>
+    <span class="job-search-card__listdate">1 day ago</span>
+    <p class="base-search-card__snippet">Python and Kubernetes. Visa sponsorship available.</p>
+  </div>
+</li>
+<li><div class="base-card"><a href="/jobs/view/3803">No title here</a></div></li>
+"""
+
+LINKEDIN_AUTHWALL = """<!DOCTYPE html>
+<html><head><title>Sign Up | LinkedIn</title></head>
+<body class="authwall">
+  <nav><ul><li><a href="/jobs/view/1">Jobs</a></li><li><a href="/people">People</a></li></ul></nav>
+  <main>Join now to see who you already know</main>
+  <footer><ul><li>About</li><li>Privacy</li></ul></footer>
+</body></html>"""
+
+INDEED_PAGE = b"""<html><body><div id="mosaic-jobResults">
+<div class="job_seen_beacon">
+  <h2 class="jobTitle"><a data-jk="abc123" href="/rc/clk?jk=abc123"><span>Python Developer</span></a></h2>
+  <span class="companyName">Initech</span>
+  <div class="companyLocation">Remote in Austin, TX</div>
+  <div class="job-snippet"><ul><li>Flask and AWS experience</li></ul></div>
+  <span class="date">Posted 3 days ago</span>
+</div>
+<div class="job_seen_beacon">
+  <h2 class="jobTitle"><a href="/rc/clk"><span>Data Engineer</span></a></h2>
+  <div class="companyLocation">New York, NY</div>
+</div>
+</div></body></html>"""
+
+
+def test_linkedin_cards():
+    card_count, jobs = LinkedInScraper()._parse_results_page(LINKEDIN_FRAGMENT)
+    assert card_count == 3
+    assert len(jobs) == 2
+
+    first, second = jobs
+    assert first['title'] == 'Senior iOS Engineer'
+    assert first['company'] == 'Acme Corp'
+    assert first['location'] == 'Remote, United States'
+    assert first['url'] == 'https://www.linkedin.com/jobs/view/senior-ios-engineer-3801'
+    assert first['postedDate'] == '2026-10-01'
+    assert first['isRemote'] is True
+    assert first['visaSponsorship'] is False and first['offersRelocation'] is False
+
+    assert second['company'] == 'Globex'
+    assert second['url'] == 'https://www.linkedin.com/jobs/view/backend-engineer-3802'
+    assert second['description'] == 'Python and Kubernetes. Visa sponsorship available.'
+    assert second['isRemote'] is False
+    assert second['visaSponsorship'] is True and second['offersRelocation'] is True
+    assert second['techStack'] == ['Python', 'Kubernetes']
+    assert second['source'] == 'LinkedIn'
+
+
+def test_linkedin_single_card_fragment():
+    single = LINKEDIN_FRAGMENT.split('</li>')[0] + '</li>'
+    card_count, jobs = LinkedInScraper()._parse_results_page(single)
+    assert card_count == 1 and jobs[0]['title'] == 'Senior iOS Engineer'
+
+
+def test_linkedin_authwall_is_not_a_results_page():
+    scraper = LinkedInScraper()
+    assert scraper._parse_results_page(LINKEDIN_AUTHWALL) == (0, [])
+    assert scraper._check_for_rate_limit(LINKEDIN_AUTHWALL)
+    assert not scraper._check_for_rate_limit(LINKEDIN_FRAGMENT)
+
+
+def test_indeed_cards():
+    card_count, jobs = IndeedScraper().parse_results_page(INDEED_PAGE)
+    assert card_count == 2 and len(jobs) == 2
+
+    first, second = jobs
+    assert first['title'] == 'Python Developer'
+    assert first['company'] == 'Initech'
+    assert first['url'] == 'https://www.indeed.com/viewjob?jk=abc123'
+    assert first['isRemote'] is True
+    assert first['description'] == 'Flask and AWS experience'
+    assert first['techStack'] == ['Python', 'Flask', 'Aws']
+
+    assert second['company'] == 'Unknown Company'
+    assert second['url'] == 'https://www.indeed.com/jobs'
+
+
+def filter_per_criterion(jobs, filters):
+    """Reference implementation: one list comprehension per filter"""
+    filtered = jobs
+    tech_filter = filters.get('techStack', [])
+    if tech_filter:
+        filtered = [
+            j for j in filtered
+            if any(tech.lower() in j.get('description', '').lower() for tech in tech_filter)
+        ]
+    if filters.get('visaSponsorship'):
+        filtered = [j for j in filtered if j.get('visaSponsorship') == True]
+    company_types = filters.get('companyTypes', [])
+    if company_types:
+        filtered = [j for j in filtered if j.get('companySize') in company_types or not j.get('companySize')]
+    return filtered
+
+
+def test_apply_filters_matches_per_criterion_filtering():
+    rng = random.Random(0)
+    techs = ['Python', 'swift', 'Go', 'KUBERNETES', 'rust']
+    sizes = ['startup', 'enterprise', 'midsize', None, '']
+    for _ in range(500):
+        jobs = [
+            {
+                'description': ' '.join(rng.sample(techs + ['team', 'remote'], rng.randint(0, 4))),
+                'visaSponsorship': rng.choice([True, False, None]),
+                'companySize': rng.choice(sizes),
+            }
+            for _ in range(rng.randint(0, 12))
+        ]
+        filters = {
+            'techStack': rng.sample(techs, rng.randint(0, 2)),
+            'visaSponsorship': rng.choice([True, False, None]),
+            'companyTypes': rng.sample(sizes[:3], rng.randint(0, 2)),
+        }
+        assert apply_filters(jobs, filters, {}) == filter_per_criterion(jobs, filters), filters
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+    print("✓ Scraper regression tests passed")
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Regression test: the single-pass skill scan in resume_parser must find
+exactly what a separate whole-word search per skill finds.
+
+Run with: python3 test_skill_extraction.py  (or pytest)
+"""
+
+import os
+import random
+import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Nextrole', 'Python'))
+
+from resume_parser import TECH_SKILLS, extract_skills, VERSION_PATTERNS
+
+
+def per_skill_scan(text: str) -> list:
+    """Reference implementation: one whole-word search per skill"""
+    text_lower = text.lower()
+    found = set()
+    for skill in TECH_SKILLS:
+        if re.search(r'\b' + re.escape(skill) + r'\b', text_lower):
+            found.add(skill.title())
+    for pattern in VERSION_PATTERNS:
+        for match in pattern.finditer(text):
+            found.add(match.group(0))
+    return sorted(found)
+
+
+CASES = [
+    "GitLab CI/CD and Travis CI/CD pipelines",
+    "gitlab ci/cd",
+    "React Native and React 18, Android Studio on Android 14",
+    "Cocoa Touch, Core Data, SwiftUI, UIKit",
+    "C++, C#, Objective-C, Node.js 20, Go, R and Rust",
+    "Worked with sql server, rest api design and jetpack compose",
+    "",
+]
+
+
+def test_known_cases():
+    for text in CASES:
+        assert extract_skills(text) == per_skill_scan(text), text
+
+
+def test_randomised_against_per_skill_scan():
+    rng = random.Random(0)
+    words = sorted(TECH_SKILLS) + ['ci', 'cd', 'studio', 'native', 'touch', 'team', 'built', '3', '15']
+    separators = [' ', ', ', '/', '-', '.', ' and ', '\n', '']
+    for _ in range(3000):
+        parts = [rng.choice(words) for _ in range(rng.randint(1, 8))]
+        text = ''.join(part + rng.choice(separators) for part in parts)
+        if rng.random() < 0.5:
+            text = text.title()
+        assert extract_skills(text) == per_skill_scan(text), text
+
+
+if __name__ == '__main__':
+    test_known_cases()
+    test_randomised_against_per_skill_scan()
+    print("✓ Skill extraction matches the per-skill scan")